@@ -7,6 +7,15 @@ from zaira import jira_client
 from zaira import confluence_api
 
 
+@pytest.fixture(autouse=True)
+def reset_site_cache():
+    """Clear memoized site lookups so each test sees its own config."""
+    yield
+    jira_client.get_server_from_config.cache_clear()
+    jira_client.get_jira_site.cache_clear()
+    jira_client.get_credentials.cache_clear()
+
+
 @pytest.fixture
 def mock_jira():
     """Provide a mock JIRA client.
@@ -10,11 +10,14 @@ from zaira.info import (
     load_schema,
     save_schema,
     update_schema,
+    update_schema_many,
     get_field_id,
     get_field_name,
     get_field_map,
     get_field_type,
     load_project_schema,
+    load_discovery_cache,
+    save_discovery_cache,
     _fetch_cached_data,
 )
 
@@ -39,6 +42,62 @@ class TestLoadSchema:
 
         assert result == schema_data
 
+    def test_reuses_parsed_schema_while_unchanged(self, tmp_path):
+        """Parses the file once while it is unchanged on disk."""
+        from zaira import info
+
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps({"fields": {"customfield_1": "Team"}}))
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info._load_json", wraps=info._load_json) as mock_load,
+        ):
+            first = load_schema()
+            first["fields"] = {}
+            second = load_schema()
+
+        assert mock_load.call_count == 1
+        assert second == {"fields": {"customfield_1": "Team"}}
+
+    def test_skips_stat_within_ttl(self, tmp_path):
+        """Trusts the parsed schema without stat() while the TTL is fresh."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps({"fields": {"customfield_1": "Team"}}))
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info._SCHEMA_TTL", 60.0),
+        ):
+            load_schema()
+            schema_file.unlink()
+            result = load_schema()
+
+        assert result == {"fields": {"customfield_1": "Team"}}
+
+    def test_loads_schema_without_orjson(self, tmp_path):
+        """Falls back to stdlib json when orjson is unavailable."""
+        schema_file = tmp_path / "schema.json"
+        schema_data = {"fields": {"customfield_123": "Story Points"}}
+        schema_file.write_text(json.dumps(schema_data))
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info.orjson", None),
+        ):
+            result = load_schema()
+
+        assert result == schema_data
+
+    def test_raises_on_empty_file(self, tmp_path):
+        """Empty schema file is reported as invalid JSON."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text("")
+
+        with patch("zaira.info.get_schema_path", return_value=schema_file):
+            with pytest.raises(ValueError):
+                load_schema()
+
 
 class TestSaveSchema:
     """Tests for save_schema function."""
@@ -58,6 +117,35 @@ class TestSaveSchema:
         loaded = json.loads(schema_file.read_text())
         assert loaded == schema_data
 
+    def test_saves_schema_without_orjson(self, tmp_path):
+        """Falls back to stdlib json when orjson is unavailable."""
+        schema_file = tmp_path / "schema.json"
+        schema_data = {"fields": {"customfield_456": "Epic Link"}}
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info.CACHE_DIR", tmp_path),
+            patch("zaira.info.orjson", None),
+        ):
+            save_schema(schema_data)
+
+        assert schema_file.read_text() == json.dumps(schema_data, indent=2)
+
+    def test_skips_write_when_unchanged(self, tmp_path):
+        """Does not rewrite the file when the content is identical."""
+        schema_file = tmp_path / "schema.json"
+        schema_data = {"fields": {"customfield_456": "Epic Link"}}
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info.CACHE_DIR", tmp_path),
+        ):
+            save_schema(schema_data)
+            with patch.object(Path, "write_bytes") as mock_write:
+                save_schema(dict(schema_data))
+
+        mock_write.assert_not_called()
+
 
 class TestUpdateSchema:
     """Tests for update_schema function."""
@@ -92,6 +180,32 @@ class TestUpdateSchema:
         assert loaded["priorities"] == ["High", "Medium", "Low"]
 
 
+class TestUpdateSchemaMany:
+    """Tests for update_schema_many function."""
+
+    def test_updates_multiple_keys_with_one_write(self, tmp_path):
+        """Updates several keys, saving the schema once."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps({"fields": {"old": "value"}}))
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info.CACHE_DIR", tmp_path),
+            patch("zaira.info.save_schema", wraps=save_schema) as mock_save,
+        ):
+            update_schema_many(
+                {
+                    "fields": {"customfield_1": "Story Points"},
+                    "fieldTypes": {"customfield_1": "number"},
+                }
+            )
+
+        assert mock_save.call_count == 1
+        loaded = json.loads(schema_file.read_text())
+        assert loaded["fields"] == {"customfield_1": "Story Points"}
+        assert loaded["fieldTypes"] == {"customfield_1": "number"}
+
+
 class TestGetFieldId:
     """Tests for get_field_id function."""
 
@@ -134,6 +248,33 @@ class TestGetFieldId:
 
         assert result is None
 
+    def test_picks_up_schema_changes(self, tmp_path):
+        """Lookups reflect a rewritten schema file."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps({"fields": {"customfield_1": "Team"}}))
+
+        with patch("zaira.info.get_schema_path", return_value=schema_file):
+            assert get_field_id("Team") == "customfield_1"
+            schema_file.write_text(
+                json.dumps({"fields": {"customfield_22": "Team", "x": "Other"}})
+            )
+            assert get_field_id("Team") == "customfield_22"
+
+    def test_picks_up_schema_changes_within_ttl(self, tmp_path):
+        """A rewritten file is indexed from its new content despite the TTL."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps({"fields": {"customfield_1": "Team"}}))
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info._SCHEMA_TTL", 60.0),
+        ):
+            assert get_field_id("Team") == "customfield_1"
+            schema_file.write_text(
+                json.dumps({"fields": {"customfield_22": "New Name"}})
+            )
+            assert get_field_id("New Name") == "customfield_22"
+
 
 class TestGetFieldName:
     """Tests for get_field_name function."""
@@ -230,6 +371,20 @@ class TestLoadProjectSchema:
 
         assert result == schema
 
+    def test_loads_project_schema_without_orjson(self, tmp_path):
+        """Falls back to stdlib json when orjson is unavailable."""
+        schema_file = tmp_path / "project_schema.json"
+        schema = {"components": ["Backend"], "labels": ["bug"]}
+        schema_file.write_text(json.dumps(schema))
+
+        with (
+            patch("zaira.info.get_project_schema_path", return_value=schema_file),
+            patch("zaira.info.orjson", None),
+        ):
+            result = load_project_schema("TEST")
+
+        assert result == schema
+
     def test_returns_none_when_no_file(self, tmp_path):
         """Returns None when file doesn't exist."""
         with patch("zaira.info.get_project_schema_path", return_value=tmp_path / "nonexistent.json"):
@@ -238,6 +393,54 @@ class TestLoadProjectSchema:
         assert result is None
 
 
+class TestDiscoveryCache:
+    """Tests for load_discovery_cache and save_discovery_cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Loads discovery results saved moments ago."""
+        cache_file = tmp_path / "zdiscover_default_TEST.json"
+        discovery = {
+            "components": ["API"],
+            "labels": ["bug"],
+            "boards": [{"id": 1, "name": "Board", "type": "scrum"}],
+        }
+
+        with (
+            patch("zaira.info.get_discovery_cache_path", return_value=cache_file),
+            patch("zaira.info.CACHE_DIR", tmp_path),
+        ):
+            save_discovery_cache("TEST", discovery)
+            result = load_discovery_cache("TEST")
+
+        assert result == discovery
+
+    def test_returns_none_when_expired(self, tmp_path):
+        """Ignores results older than DISCOVERY_TTL."""
+        import os
+
+        from zaira.info import DISCOVERY_TTL
+
+        cache_file = tmp_path / "zdiscover_default_TEST.json"
+        cache_file.write_text(json.dumps({"components": [], "labels": [], "boards": []}))
+        old = cache_file.stat().st_mtime - DISCOVERY_TTL - 1
+        os.utime(cache_file, (old, old))
+
+        with patch("zaira.info.get_discovery_cache_path", return_value=cache_file):
+            result = load_discovery_cache("TEST")
+
+        assert result is None
+
+    def test_returns_none_when_no_file(self, tmp_path):
+        """Returns None when nothing is cached."""
+        with patch(
+            "zaira.info.get_discovery_cache_path",
+            return_value=tmp_path / "nonexistent.json",
+        ):
+            result = load_discovery_cache("TEST")
+
+        assert result is None
+
+
 class TestFetchCachedData:
     """Tests for _fetch_cached_data function."""
 
@@ -459,6 +662,26 @@ class TestStatusesCommand:
         captured = capsys.readouterr()
         assert "Open" in captured.out
 
+    def test_statuses_without_category(self, mock_jira, capsys, tmp_path):
+        """Stores None category when statuses have no statusCategory."""
+        from types import SimpleNamespace
+        from zaira.info import statuses_command
+        import argparse
+
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text("{}")
+        mock_jira.statuses.return_value = [SimpleNamespace(name="Open")]
+
+        args = argparse.Namespace(refresh=True)
+
+        with (
+            patch("zaira.info.get_schema_path", return_value=schema_file),
+            patch("zaira.info.CACHE_DIR", tmp_path),
+        ):
+            statuses_command(args)
+
+        assert json.loads(schema_file.read_text())["statuses"] == {"Open": None}
+
     def test_handles_api_error(self, mock_jira, capsys, tmp_path):
         """Handles API errors gracefully."""
         from zaira.info import statuses_command
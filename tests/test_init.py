@@ -1,6 +1,8 @@
 """Tests for init module."""
 
-from unittest.mock import MagicMock
+import argparse
+import io
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -10,7 +12,12 @@ from zaira.init import (
     discover_components,
     discover_labels,
     discover_boards,
+    init_project_command,
+    check_credentials,
+    setup_credentials,
+    write_config,
 )
+from zaira.types import BoardSummary
 
 
 class TestSlugify:
@@ -57,8 +64,8 @@ class TestGenerateConfig:
             site="site.com",
             all_boards={
                 "PROJ": [
-                    {"id": 123, "name": "Kanban Board", "type": "kanban"},
-                    {"id": 456, "name": "Sprint Board", "type": "scrum"},
+                    BoardSummary(123, "Kanban Board", "kanban"),
+                    BoardSummary(456, "Sprint Board", "scrum"),
                 ]
             },
             all_components={},
@@ -93,15 +100,26 @@ class TestGenerateConfig:
         assert "PROJ1" in result
         assert "PROJ2" in result
 
+    def test_write_config_matches_generate_config(self):
+        """Streams the same content that generate_config returns."""
+        kwargs = dict(
+            projects=["PROJ"],
+            site="site.com",
+            all_boards={"PROJ": [BoardSummary(1, "Board", "scrum")]},
+            all_components={"PROJ": ["API"]},
+        )
+        fp = io.StringIO()
+
+        write_config(fp, **kwargs)
+
+        assert fp.getvalue() == generate_config(**kwargs)
+
 
 class TestDiscoverComponents:
     """Tests for discover_components with mocked Jira."""
 
     def test_returns_component_names(self, mock_jira):
         """Returns sorted list of component names."""
-        mock_proj = MagicMock()
-        mock_jira.project.return_value = mock_proj
-
         comp1 = MagicMock()
         comp1.name = "Backend"
         comp2 = MagicMock()
@@ -117,9 +135,6 @@ class TestDiscoverComponents:
 
     def test_filters_empty_names(self, mock_jira):
         """Filters out components with empty names."""
-        mock_proj = MagicMock()
-        mock_jira.project.return_value = mock_proj
-
         comp1 = MagicMock()
         comp1.name = "Valid"
         comp2 = MagicMock()
@@ -133,9 +148,18 @@ class TestDiscoverComponents:
 
         assert result == ["Valid"]
 
+    def test_fetches_components_by_key(self, mock_jira):
+        """Fetches components with one call, without loading the project."""
+        mock_jira.project_components.return_value = []
+
+        discover_components("TEST")
+
+        mock_jira.project_components.assert_called_once_with("TEST")
+        mock_jira.project.assert_not_called()
+
     def test_returns_empty_on_error(self, mock_jira):
         """Returns empty list on error."""
-        mock_jira.project.side_effect = Exception("Not found")
+        mock_jira.project_components.side_effect = Exception("Not found")
 
         result = discover_components("INVALID")
 
@@ -147,25 +171,36 @@ class TestDiscoverLabels:
 
     def test_returns_labels_from_issues(self, mock_jira):
         """Returns sorted unique labels from issues."""
-        issue1 = MagicMock()
-        issue1.fields.labels = ["bug", "urgent"]
-        issue2 = MagicMock()
-        issue2.fields.labels = ["bug", "feature"]
-        issue3 = MagicMock()
-        issue3.fields.labels = []
-
-        mock_jira.search_issues.return_value = [issue1, issue2, issue3]
+        mock_jira.search_issues.return_value = {
+            "issues": [
+                {"key": "TEST-1", "fields": {"labels": ["bug", "urgent"]}},
+                {"key": "TEST-2", "fields": {"labels": ["bug", "feature"]}},
+                {"key": "TEST-3", "fields": {"labels": []}},
+            ]
+        }
 
         result = discover_labels("TEST")
 
         assert result == ["bug", "feature", "urgent"]  # sorted, unique
 
+    def test_requests_only_labelled_issues(self, mock_jira):
+        """Requests only labelled issues and the labels field as raw JSON."""
+        mock_jira.search_issues.return_value = {"issues": []}
+
+        discover_labels("TEST")
+
+        jql = mock_jira.search_issues.call_args.args[0]
+        assert "labels IS NOT EMPTY" in jql
+        kwargs = mock_jira.search_issues.call_args.kwargs
+        assert kwargs["fields"] == "labels"
+        assert kwargs["json_result"] is True
+        assert kwargs["maxResults"] == 500
+
     def test_handles_none_labels(self, mock_jira):
         """Handles issues with None labels."""
-        issue1 = MagicMock()
-        issue1.fields.labels = None
-
-        mock_jira.search_issues.return_value = [issue1]
+        mock_jira.search_issues.return_value = {
+            "issues": [{"key": "TEST-1", "fields": {"labels": None}}]
+        }
 
         result = discover_labels("TEST")
 
@@ -184,7 +219,7 @@ class TestDiscoverBoards:
     """Tests for discover_boards with mocked Jira."""
 
     def test_returns_board_info(self, mock_jira):
-        """Returns list of board dicts."""
+        """Returns list of board summaries."""
         board1 = MagicMock()
         board1.id = 100
         board1.name = "Kanban"
@@ -200,8 +235,8 @@ class TestDiscoverBoards:
         result = discover_boards("TEST")
 
         assert len(result) == 2
-        assert result[0] == {"id": 100, "name": "Kanban", "type": "kanban"}
-        assert result[1] == {"id": 200, "name": "Scrum", "type": "scrum"}
+        assert result[0] == BoardSummary(100, "Kanban", "kanban")
+        assert result[1] == BoardSummary(200, "Scrum", "scrum")
 
     def test_returns_empty_on_error(self, mock_jira):
         """Returns empty list on error."""
@@ -210,3 +245,175 @@ class TestDiscoverBoards:
         result = discover_boards("TEST")
 
         assert result == []
+
+
+class TestInitProjectCommand:
+    """Tests for init_project_command with mocked Jira."""
+
+    def test_discovers_all_projects(self, mock_jira, capsys, tmp_path, monkeypatch):
+        """Discovers metadata for each project and writes config."""
+        monkeypatch.chdir(tmp_path)
+
+        comp = MagicMock()
+        comp.name = "Backend"
+        mock_jira.project_components.return_value = [comp]
+        mock_jira.search_issues.return_value = {
+            "issues": [{"key": "ONE-1", "fields": {"labels": ["bug"]}}]
+        }
+        board = MagicMock()
+        board.id = 7
+        board.name = "Team Board"
+        board.type = "scrum"
+        mock_jira.boards.return_value = [board]
+
+        args = argparse.Namespace(
+            projects=["ONE", "TWO"], site="site.com", force=False, refresh=False
+        )
+
+        with (
+            patch("zaira.init.check_credentials", return_value=True),
+            patch("zaira.init.fetch_and_save_schema") as mock_fetch_schema,
+            patch("zaira.init.save_project_schema") as mock_save,
+            patch("zaira.init.load_discovery_cache", return_value=None),
+            patch("zaira.init.save_discovery_cache") as mock_save_discovery,
+        ):
+            init_project_command(args)
+
+        mock_fetch_schema.assert_called_once_with(profile="default")
+        config = (tmp_path / "zproject.toml").read_text()
+        assert "team-board = 7" in config
+        assert "one-backend" in config
+        assert "two-backend" in config
+        saved = {c.args[0]: c.args[1] for c in mock_save.call_args_list}
+        assert saved["ONE"] == {"components": ["Backend"], "labels": ["bug"]}
+        assert saved["TWO"] == {"components": ["Backend"], "labels": ["bug"]}
+        out = capsys.readouterr().out
+        assert out.index("ONE:") < out.index("TWO:")
+        assert mock_save_discovery.call_count == 2
+
+    def test_uses_cached_discovery(self, mock_jira, capsys, tmp_path, monkeypatch):
+        """Skips discovery for projects with fresh cached results."""
+        monkeypatch.chdir(tmp_path)
+        cached = {
+            "components": ["API"],
+            "labels": ["bug"],
+            "boards": [{"id": 3, "name": "Cached Board", "type": "kanban"}],
+        }
+        args = argparse.Namespace(
+            projects=["ONE"], site="site.com", force=False, refresh=False
+        )
+
+        with (
+            patch("zaira.init.check_credentials", return_value=True),
+            patch("zaira.init.fetch_and_save_schema") as mock_fetch_schema,
+            patch("zaira.init.save_project_schema"),
+            patch("zaira.init.load_discovery_cache", return_value=cached),
+            patch("zaira.init.save_discovery_cache") as mock_save_discovery,
+        ):
+            init_project_command(args)
+
+        mock_jira.project_components.assert_not_called()
+        mock_jira.boards.assert_not_called()
+        mock_save_discovery.assert_not_called()
+        mock_fetch_schema.assert_called_once_with(profile="default")
+        assert "cached-board = 3" in (tmp_path / "zproject.toml").read_text()
+        assert "(cached" in capsys.readouterr().out
+
+    def test_refresh_ignores_cache(self, mock_jira, tmp_path, monkeypatch):
+        """Re-discovers metadata when --refresh is given."""
+        monkeypatch.chdir(tmp_path)
+        mock_jira.project_components.return_value = []
+        mock_jira.search_issues.return_value = {"issues": []}
+        mock_jira.boards.return_value = []
+        args = argparse.Namespace(
+            projects=["ONE"], site="site.com", force=False, refresh=True
+        )
+
+        with (
+            patch("zaira.init.check_credentials", return_value=True),
+            patch("zaira.init.fetch_and_save_schema"),
+            patch("zaira.init.save_project_schema"),
+            patch("zaira.init.load_discovery_cache") as mock_load_discovery,
+            patch("zaira.init.save_discovery_cache") as mock_save_discovery,
+        ):
+            init_project_command(args)
+
+        mock_load_discovery.assert_not_called()
+        mock_jira.project_components.assert_called_once_with("ONE")
+        # Nothing found - possibly a failed lookup, so nothing is cached
+        mock_save_discovery.assert_not_called()
+
+    def test_force_over_profiled_config(self, mock_jira, tmp_path, monkeypatch):
+        """Caches go under the new config's profile, not the replaced one."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "zproject.toml").write_text('[project]\nprofile = "x"\n')
+        cache_dir = tmp_path / "cache"
+        mock_jira.project_components.return_value = []
+        mock_jira.search_issues.return_value = {"issues": []}
+        mock_jira.boards.return_value = []
+        args = argparse.Namespace(
+            projects=["ONE"], site="site.com", force=True, refresh=False
+        )
+
+        with (
+            patch("zaira.init.check_credentials", return_value=True),
+            patch("zaira.jira_client.CACHE_DIR", cache_dir),
+            patch("zaira.info.CACHE_DIR", cache_dir),
+            patch(
+                "zaira.info._SCHEMA_FETCHERS",
+                (("fields", lambda jira: {"fields": {}}),),
+            ),
+        ):
+            init_project_command(args)
+
+        assert (cache_dir / "zschema_default.json").exists()
+        assert (cache_dir / "zproject_default_ONE.json").exists()
+        assert not list(cache_dir.glob("*_x*"))
+
+
+class TestSetupCredentials:
+    """Tests for setup_credentials function."""
+
+    def test_creates_template(self, tmp_path, capsys):
+        """Writes a credentials template and explains how to fill it in."""
+        creds_file = tmp_path / "zaira" / "credentials.toml"
+
+        with patch("zaira.init.CREDENTIALS_FILE", creds_file):
+            setup_credentials()
+
+        assert 'api_token = "your-api-token"' in creds_file.read_text()
+        out = capsys.readouterr().out
+        assert out.startswith(f"Created {creds_file}\n\n")
+        assert "  3. Add your API token" in out
+        assert out.endswith("\nThen run 'zaira init' again.\n")
+
+    def test_existing_file_left_untouched(self, tmp_path, capsys):
+        """Leaves an existing credentials file alone."""
+        creds_file = tmp_path / "credentials.toml"
+        creds_file.write_text('email = "me@example.com"\n')
+
+        with patch("zaira.init.CREDENTIALS_FILE", creds_file):
+            setup_credentials()
+
+        assert creds_file.read_text() == 'email = "me@example.com"\n'
+        out = capsys.readouterr().out
+        assert out.startswith("Credentials file exists but is not configured")
+        assert "Please edit this file" in out
+
+
+class TestCheckCredentials:
+    """Tests for check_credentials function."""
+
+    def test_all_fields_present(self):
+        """Returns True when site, email and token are all set."""
+        creds = {"site": "x.atlassian.net", "email": "me@x.com", "api_token": "t"}
+        with patch("zaira.init.load_credentials", return_value=creds):
+            assert check_credentials() is True
+
+    @pytest.mark.parametrize("missing", ["site", "email", "api_token"])
+    def test_missing_field(self, missing):
+        """Returns False when any required field is missing or empty."""
+        creds = {"site": "x.atlassian.net", "email": "me@x.com", "api_token": "t"}
+        creds[missing] = ""
+        with patch("zaira.init.load_credentials", return_value=creds):
+            assert check_credentials() is False
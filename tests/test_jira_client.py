@@ -158,6 +158,36 @@ class TestLoadCredentials:
 
         assert result == {}
 
+    def test_parses_file_once(self, tmp_path):
+        """Reuses the parsed file and hands out independent copies."""
+        creds_file = tmp_path / "credentials.toml"
+        creds_file.write_text('email = "user@example.com"\n')
+
+        with (
+            patch.object(jira_client, "CREDENTIALS_FILE", creds_file),
+            patch("zaira.jira_client.tomllib.load", wraps=jira_client.tomllib.load) as mock_load,
+        ):
+            first = jira_client.load_credentials()
+            first["email"] = "changed"
+            second = jira_client.load_credentials()
+
+        assert mock_load.call_count == 1
+        assert second == {"email": "user@example.com"}
+
+    def test_save_invalidates_cache(self, tmp_path):
+        """Saving credentials makes the next load re-read the file."""
+        creds_file = tmp_path / "credentials.toml"
+
+        with (
+            patch.object(jira_client, "CREDENTIALS_FILE", creds_file),
+            patch.object(jira_client, "CONFIG_DIR", tmp_path),
+        ):
+            assert jira_client.load_credentials() == {}
+            jira_client.save_credentials("user@example.com", "secret")
+            result = jira_client.load_credentials()
+
+        assert result == {"email": "user@example.com", "api_token": "secret"}
+
 
 class TestGetJiraSite:
     """Tests for get_jira_site function."""
@@ -169,6 +199,15 @@ class TestGetJiraSite:
 
         assert result == "example.atlassian.net"
 
+    def test_memoizes_result(self):
+        """Reads credentials once across repeated calls."""
+        with patch.object(jira_client, "load_credentials", return_value={"site": "example.atlassian.net"}) as mock_load:
+            jira_client.get_jira_site()
+            result = jira_client.get_jira_site()
+
+        assert result == "example.atlassian.net"
+        assert mock_load.call_count == 1
+
     def test_strips_http_protocol(self, tmp_path, monkeypatch):
         """Strips http:// from site."""
         with patch.object(jira_client, "load_credentials", return_value={"site": "http://jira.example.com"}):
@@ -228,3 +267,55 @@ class TestJiraClientInjection:
         jira_client.set_jira(None)
 
         assert jira_client._jira_client is None
+
+
+class TestGetCredentials:
+    """Tests for get_credentials function."""
+
+    def test_memoizes_result(self):
+        """Resolves credentials once across repeated calls."""
+        creds = {"email": "user@example.com", "api_token": "secret"}
+        with (
+            patch.object(jira_client, "get_server_from_config", return_value="https://x.atlassian.net"),
+            patch.object(jira_client, "load_credentials", return_value=creds) as mock_load,
+        ):
+            first = jira_client.get_credentials()
+            second = jira_client.get_server_url()
+
+        assert first == ("https://x.atlassian.net", "user@example.com", "secret")
+        assert second == "https://x.atlassian.net"
+        assert mock_load.call_count == 1
+
+    def test_exits_when_not_configured(self):
+        """Exits with an error when credentials are missing."""
+        with (
+            patch.object(jira_client, "get_server_from_config", return_value=None),
+            patch.object(jira_client, "load_credentials", return_value={}),
+            pytest.raises(SystemExit),
+        ):
+            jira_client.get_credentials()
+
+
+class TestGetDefaultJira:
+    """Tests for _get_default_jira function."""
+
+    def test_mounts_larger_connection_pool(self):
+        """Mounts an HTTPS adapter sized for concurrent requests."""
+        from jira.resources import Issue
+
+        creds = ("https://example.atlassian.net", "user", "token")
+        with (
+            patch.object(jira_client, "get_credentials", return_value=creds),
+            patch("jira.JIRA") as mock_jira_cls,
+        ):
+            client = jira_client._get_default_jira()
+        jira_client.reset_jira()
+
+        mock_jira_cls.assert_called_once_with(
+            server="https://example.atlassian.net",
+            basic_auth=("user", "token"),
+            default_batch_sizes={Issue: jira_client.SEARCH_BATCH_SIZE},
+        )
+        prefix, adapter = client._session.mount.call_args.args
+        assert prefix == "https://"
+        assert adapter._pool_maxsize == jira_client.HTTP_POOL_SIZE
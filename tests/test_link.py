@@ -54,7 +54,8 @@ class TestCreateLink:
         mock_lt.name = "Blocks"
         mock_jira.issue_link_types.return_value = [mock_lt]
 
-        result = create_link("TEST-1", "TEST-2", "Invalid")
+        with patch("zaira.link.load_schema", return_value=None):
+            result = create_link("TEST-1", "TEST-2", "Invalid")
 
         assert result is False
         captured = capsys.readouterr()
@@ -62,6 +63,26 @@ class TestCreateLink:
         assert "Valid link types:" in captured.err
         assert "Blocks" in captured.err
 
+    def test_lists_link_types_from_cached_schema(self, mock_jira, capsys):
+        """Lists valid link types from the cached schema without an API call."""
+        mock_jira.create_issue_link.side_effect = Exception(
+            "No issue link type with name 'Invalid'"
+        )
+        schema = {
+            "linkTypes": {
+                "Relates": {"outward": "relates to", "inward": "relates to"},
+                "Blocks": {"outward": "blocks", "inward": "is blocked by"},
+            }
+        }
+
+        with patch("zaira.link.load_schema", return_value=schema):
+            result = create_link("TEST-1", "TEST-2", "Invalid")
+
+        assert result is False
+        mock_jira.issue_link_types.assert_not_called()
+        err = capsys.readouterr().err
+        assert err.index("  Blocks") < err.index("  Relates")
+
 
 class TestLinkCommand:
     """Tests for link_command function."""
@@ -1,5 +1,7 @@
 """Tests for markdown conversion utilities."""
 
+import pytest
+
 from zaira.mdconv import (
     markdown_to_storage,
     storage_to_markdown,
@@ -178,6 +180,77 @@ class TestMarkdownToStorage:
         assert '<ac:structured-macro ac:name="toc"/>' in html
         assert "[TOC]" not in html
 
+    def test_code_block_content_left_alone(self):
+        """[TOC] and img tags inside a code block stay literal."""
+        md = '```\n[TOC]\n<img src="attachment:a.png"/>\n```'
+        html = markdown_to_storage(md)
+        assert '[TOC]\n<img src="attachment:a.png"/>' in html
+        assert 'ac:name="toc"' not in html
+        assert "<ac:image" not in html
+
+    def test_image_in_nested_list(self):
+        """Images are converted and list indents normalized together."""
+        md = "- a\n  - ![pic](./images/pic.png)"
+        html = markdown_to_storage(md)
+        assert '<ac:image ac:alt="pic"><ri:attachment ri:filename="pic.png"/>' in html
+        assert html.count("<ul>") == 2
+
+    def test_image_alt_spanning_lines(self):
+        """An image whose alt text wraps onto the next line is still converted."""
+        html = markdown_to_storage("![long\nalt](./images/pic.png)")
+        assert 'ri:filename="pic.png"' in html
+
+    def test_image_references_in_code_left_alone(self):
+        """Image syntax inside code is not turned into an attachment."""
+        html = markdown_to_storage("```\n![pic](./images/pic.png)\n```")
+        assert "![pic](./images/pic.png)" in html
+        assert "<ac:image" not in html
+
+    def test_remote_image_unchanged(self):
+        html = markdown_to_storage("![logo](https://example.com/logo.png)")
+        assert '<img alt="logo" src="https://example.com/logo.png" />' in html
+
+    def test_raw_html_local_image_not_converted(self):
+        """A raw HTML <img> is left alone, as its file is never uploaded."""
+        md = '<img src="local.png" />\n\n![pic](./images/pic.png)'
+        assert extract_local_images(md) == [("pic", "./images/pic.png")]
+        html = markdown_to_storage(md)
+        assert '<img src="local.png" />' in html
+        assert 'ri:filename="local.png"' not in html
+        assert 'ri:filename="pic.png"' in html
+
+    def test_local_image_path_with_ampersand(self):
+        """Paths the markdown library HTML-escapes still match their upload."""
+        html = markdown_to_storage("![a](./images/x&y.png)")
+        assert '<ri:attachment ri:filename="x&amp;y.png"/>' in html
+
+    def test_local_image_with_title(self):
+        """A titled image is converted and uploaded under its bare path."""
+        md = '![a](./images/foo.png "A title")'
+        assert extract_local_images(md) == [("a", "./images/foo.png")]
+        html = markdown_to_storage(md)
+        assert '<ac:image ac:alt="a"><ri:attachment ri:filename="foo.png"/>' in html
+
+    def test_local_image_with_escaped_path(self):
+        """Backslash escapes in the path are resolved as markdown does."""
+        md = r"![a](./images/my\_pic.png)"
+        assert extract_local_images(md) == [("a", "./images/my_pic.png")]
+        assert 'ri:filename="my_pic.png"' in markdown_to_storage(md)
+
+    def test_local_images_kept_without_conversion(self):
+        """With convert_local_images=False only attachment refs are converted."""
+        md = "![a](./images/a.png) ![b](attachment:b.png)"
+        html = markdown_to_storage(md, convert_local_images=False)
+        assert 'src="./images/a.png"' in html
+        assert '<ac:image ac:alt="b"><ri:attachment ri:filename="b.png"/>' in html
+
+    def test_repeated_conversions_independent(self):
+        """Reusing the converter does not carry state between documents."""
+        first = markdown_to_storage("```py\nx = 1\n```\n\n- a")
+        second = markdown_to_storage("plain")
+        assert second == "<p>plain</p>"
+        assert markdown_to_storage("```py\nx = 1\n```\n\n- a") == first
+
     def test_unordered_list(self):
         md = "- Item 1\n- Item 2"
         html = markdown_to_storage(md)
@@ -273,6 +346,22 @@ class TestStorageToMarkdown:
         # Should have empty language (just ```)
         assert "```\n" in md
 
+    def test_html_entities(self):
+        """HTML-only entities are expanded; CDATA code is left verbatim."""
+        html = (
+            "<p>a&nbsp;b &mdash; c&hellip;</p>"
+            '<ac:structured-macro ac:name="code">'
+            "<ac:plain-text-body><![CDATA[&nbsp;]]></ac:plain-text-body>"
+            "</ac:structured-macro>"
+        )
+        md = storage_to_markdown(html)
+        assert "a\u00a0b \u2014 c\u2026" in md
+        assert "```\n&nbsp;\n```" in md
+
+    def test_unknown_entity_raises(self):
+        with pytest.raises(ValueError, match="Failed to parse"):
+            storage_to_markdown("<p>&copy;</p>")
+
     def test_toc_macro(self):
         html = '<ac:structured-macro ac:name="toc"/>'
         md = storage_to_markdown(html)
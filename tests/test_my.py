@@ -27,6 +27,16 @@ class TestSearchMyTickets:
         assert result[0]["status"] == "Open"
         assert result[0]["summary"] == "Test ticket"
 
+    def test_requests_only_displayed_fields(self, mock_jira):
+        """Fetches all matches but only the fields the table shows."""
+        mock_jira.search_issues.return_value = []
+
+        search_my_tickets("assignee = currentUser()")
+
+        kwargs = mock_jira.search_issues.call_args.kwargs
+        assert kwargs["maxResults"] is False
+        assert kwargs["fields"] == "summary,status,created"
+
     def test_handles_missing_status(self, mock_jira):
         """Handles tickets with missing status."""
         mock_issue = MagicMock()
@@ -102,3 +112,23 @@ class TestPrintTable:
         oldest_pos = captured.out.find("T-1")
         newest_pos = captured.out.find("T-3")
         assert oldest_pos < newest_pos
+
+    def test_ages_share_one_clock_read(self, capsys):
+        """Measures every age against the same current time."""
+        from datetime import UTC, datetime
+        from unittest.mock import patch
+
+        tickets = [
+            {"key": "T-1", "status": "Open", "created": "2026-01-11T14:30:00.000+0000", "summary": "A"},
+            {"key": "T-2", "status": "Done", "created": "2026-01-12T14:30:00.000+0000", "summary": "B"},
+        ]
+        fixed_now = datetime(2026, 1, 14, 14, 30, tzinfo=UTC)
+
+        with patch("zaira.my.datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed_now
+            print_table(tickets)
+
+        mock_datetime.now.assert_called_once_with(UTC)
+        captured = capsys.readouterr()
+        assert "T-1     3d  A" in captured.out
+        assert "T-2     2d  B" in captured.out
@@ -33,6 +33,40 @@ main = 123
         result = project.load_config()
         assert result == {}
 
+    def test_parses_once_while_unchanged(self, tmp_path, monkeypatch):
+        """Repeated loads reuse the parsed config."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "zproject.toml").write_bytes(b"[boards]\nmain = 1\n")
+
+        with patch("zaira.project.tomllib.load", wraps=project.tomllib.load) as load:
+            project.load_config()
+            project.load_config()
+
+        assert load.call_count == 1
+
+    def test_picks_up_edits(self, tmp_path, monkeypatch):
+        """Reloads when the file changes."""
+        monkeypatch.chdir(tmp_path)
+        config_file = tmp_path / "zproject.toml"
+        config_file.write_bytes(b"[boards]\nmain = 1\n")
+        assert project.load_config()["boards"]["main"] == 1
+
+        config_file.write_bytes(b"[boards]\nmain = 22\n")
+        assert project.load_config()["boards"]["main"] == 22
+
+    def test_per_directory(self, tmp_path, monkeypatch):
+        """Configs in different directories are cached separately."""
+        for name, board in (("a", 1), ("b", 2)):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "zproject.toml").write_bytes(
+                f"[boards]\nmain = {board}\n".encode()
+            )
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert project.load_config()["boards"]["main"] == 1
+        monkeypatch.chdir(tmp_path / "b")
+        assert project.load_config()["boards"]["main"] == 2
+
 
 class TestGetQuery:
     """Tests for get_query function."""
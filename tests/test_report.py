@@ -1,7 +1,7 @@
 """Tests for report module."""
 
 import json
-from datetime import datetime, timezone, timedelta
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,7 +15,6 @@ from zaira.report import (
     generate_json_report,
     generate_csv_report,
     search_tickets,
-    get_ticket_dates,
 )
 
 
@@ -98,13 +97,13 @@ class TestHumanizeAge:
 
     def test_recent_seconds(self):
         """Returns 'now' for very recent timestamps."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         ts = now.isoformat()
         assert humanize_age(ts) == "now"
 
     def test_minutes_ago(self):
         """Returns minutes for timestamps < 1 hour."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         ts = (now - timedelta(minutes=30)).isoformat()
         result = humanize_age(ts)
         assert result.endswith("m")
@@ -112,39 +111,61 @@ class TestHumanizeAge:
 
     def test_hours_ago(self):
         """Returns hours for timestamps < 1 day."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         ts = (now - timedelta(hours=5)).isoformat()
         result = humanize_age(ts)
         assert result.endswith("h")
 
     def test_days_ago(self):
         """Returns days for timestamps < 1 week."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         ts = (now - timedelta(days=3)).isoformat()
         result = humanize_age(ts)
         assert result.endswith("d")
 
     def test_weeks_ago(self):
         """Returns weeks for timestamps < 1 month."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         ts = (now - timedelta(weeks=2)).isoformat()
         result = humanize_age(ts)
         assert result.endswith("w")
 
     def test_months_ago(self):
         """Returns months for timestamps < 1 year."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         ts = (now - timedelta(days=60)).isoformat()
         result = humanize_age(ts)
         assert result.endswith("mo")
 
     def test_years_ago(self):
         """Returns years for old timestamps."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         ts = (now - timedelta(days=400)).isoformat()
         result = humanize_age(ts)
         assert result.endswith("y")
 
+    def test_jira_offset_format(self):
+        """Parses Jira's +0000 offset suffix."""
+        now = datetime(2026, 1, 14, 14, 30, tzinfo=UTC)
+        assert humanize_age("2026-01-11T14:30:00.000+0000", now) == "3d"
+
+    def test_uses_given_now(self):
+        """Measures age against the supplied reference time."""
+        now = datetime(2026, 1, 11, 16, 30, tzinfo=UTC)
+        assert humanize_age("2026-01-11T14:30:00+00:00", now=now) == "2h"
+
+    def test_repeated_timestamps_parsed_once(self):
+        """Identical timestamps reuse the cached parse."""
+        from zaira.report import _parse_iso
+
+        _parse_iso.cache_clear()
+        now = datetime(2026, 1, 14, 14, 30, tzinfo=UTC)
+        for _ in range(3):
+            humanize_age("2026-01-11T14:30:00.000+0000", now)
+        info = _parse_iso.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
 
 class TestGenerateFrontMatter:
     """Tests for generate_front_matter function."""
@@ -277,6 +298,27 @@ class TestGenerateTable:
 
         assert "\\|" in result
 
+    def test_reads_clock_once(self):
+        """Reads the current time once for the whole table."""
+        tickets = [
+            {
+                "key": f"TEST-{i}",
+                "issuetype": "Bug",
+                "status": "Open",
+                "updated": "2026-01-11T14:30:00.000+0000",
+                "summary": "Test",
+            }
+            for i in range(3)
+        ]
+        fixed_now = datetime(2026, 1, 14, 14, 30, tzinfo=UTC)
+        with patch("zaira.report.datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed_now
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            result = generate_table(tickets)
+
+        mock_datetime.now.assert_called_once_with(UTC)
+        assert result.count(" 3d ") == 3
+
     def test_truncates_long_summaries(self):
         """Truncates summaries longer than 200 characters."""
         tickets = [
@@ -377,6 +419,24 @@ class TestGenerateCsvReport:
         result = generate_csv_report([])
         assert result == ""
 
+    def test_writes_to_file(self):
+        """Streams rows to the given file and returns None."""
+        import io
+
+        tickets = [
+            {
+                "key": "T-1",
+                "summary": "Test",
+                "labels": ["a", "b"],
+                "parent": {"key": "EPIC-1", "summary": "Epic"},
+            }
+        ]
+        buf = io.StringIO()
+
+        assert generate_csv_report(tickets, buf) is None
+        assert buf.getvalue() == generate_csv_report(tickets)
+        assert "EPIC-1" in buf.getvalue()
+
     def test_csv_header(self):
         """Generates CSV with header."""
         tickets = [
@@ -473,6 +533,19 @@ class TestSearchTickets:
         assert result[0]["summary"] == "Test ticket"
         assert result[0]["status"] == "Open"
 
+    def test_search_requests_used_fields(self, mock_jira):
+        """Fetches all matches but only the fields the ticket dicts use."""
+        mock_jira.search_issues.return_value = []
+
+        search_tickets("project = TEST")
+
+        kwargs = mock_jira.search_issues.call_args.kwargs
+        assert kwargs["maxResults"] is False
+        fields = kwargs["fields"].split(",")
+        assert "updated" in fields
+        assert "parent" in fields
+        assert "*all" not in fields
+
     def test_search_handles_error(self, mock_jira, capsys):
         """Handles search errors gracefully."""
         mock_jira.search_issues.side_effect = Exception("API Error")
@@ -484,30 +557,6 @@ class TestSearchTickets:
         assert "Error searching" in captured.out
 
 
-class TestGetTicketDates:
-    """Tests for get_ticket_dates function with mocked Jira."""
-
-    def test_returns_dates(self, mock_jira):
-        """Returns created and updated dates."""
-        mock_issue = MagicMock()
-        mock_issue.fields.created = "2024-01-01T10:00:00"
-        mock_issue.fields.updated = "2024-01-02T15:00:00"
-        mock_jira.issue.return_value = mock_issue
-
-        result = get_ticket_dates("TEST-1")
-
-        assert result["created"] == "2024-01-01T10:00:00"
-        assert result["updated"] == "2024-01-02T15:00:00"
-
-    def test_handles_error(self, mock_jira):
-        """Returns empty strings on error."""
-        mock_jira.issue.side_effect = Exception("Not found")
-
-        result = get_ticket_dates("INVALID-1")
-
-        assert result == {"created": "", "updated": ""}
-
-
 class TestGenerateDashboardReport:
     """Tests for generate_dashboard_report function."""
 
@@ -613,6 +662,71 @@ class TestGenerateDashboardReport:
         assert "### Done" in result
         assert total == 2
 
+    def test_sections_follow_gadget_position(self, mock_jira):
+        """Renders sections in dashboard order regardless of fetch order."""
+        from zaira.report import generate_dashboard_report
+
+        mock_dashboard = MagicMock()
+        mock_dashboard.name = "Ordered"
+        mock_dashboard.description = None
+        mock_dashboard.view_url = "https://jira.example.com/dashboard/7"
+
+        gadgets = []
+        for gadget_id, position in ((1, 2), (2, 0), (3, 1)):
+            gadget = MagicMock()
+            gadget.id = gadget_id
+            gadget.filter_name = f"Filter {gadget_id}"
+            gadget.jql = f"project = P{gadget_id}"
+            gadget.position = position
+            gadgets.append(gadget)
+
+        def fake_search(jql):
+            n = int(jql[-1])
+            return [{"key": f"P{n}-{i}", "summary": "", "updated": ""} for i in range(n)]
+
+        with (
+            patch("zaira.report.get_dashboard", return_value=mock_dashboard),
+            patch("zaira.report.get_dashboard_gadgets", return_value=gadgets),
+            patch("zaira.report.search_tickets", side_effect=fake_search),
+        ):
+            result, total = generate_dashboard_report(7, to_stdout=True)
+
+        assert total == 6
+        assert result.index("## Filter 2") < result.index("## Filter 3")
+        assert result.index("## Filter 3") < result.index("## Filter 1")
+        assert "P1-0" in result.split("## Filter 1")[1]
+
+    def test_progress_output(self, mock_jira, capsys):
+        """Prints each gadget's progress in dashboard order."""
+        from zaira.report import generate_dashboard_report
+
+        mock_dashboard = MagicMock()
+        mock_dashboard.name = "Progress"
+        mock_dashboard.description = None
+        mock_dashboard.view_url = "https://jira.example.com/dashboard/8"
+
+        gadgets = []
+        for gadget_id, position in ((1, 1), (2, 0)):
+            gadget = MagicMock()
+            gadget.id = gadget_id
+            gadget.filter_name = f"Filter {gadget_id}"
+            gadget.jql = f"project = P{gadget_id}"
+            gadget.position = position
+            gadgets.append(gadget)
+
+        with (
+            patch("zaira.report.get_dashboard", return_value=mock_dashboard),
+            patch("zaira.report.get_dashboard_gadgets", return_value=gadgets),
+            patch("zaira.report.search_tickets", return_value=[]),
+        ):
+            generate_dashboard_report(8)
+
+        out = capsys.readouterr().out
+        assert (
+            "  Running: Filter 2\n    Found 0 tickets\n"
+            "  Running: Filter 1\n    Found 0 tickets\n"
+        ) in out
+
 
 class TestReportCommand:
     """Tests for report_command function."""
@@ -301,6 +301,12 @@ def main() -> None:
         action="store_true",
         help="Overwrite existing zproject.toml",
     )
+    init_project_parser.add_argument(
+        "-r",
+        "--refresh",
+        action="store_true",
+        help="Re-discover project metadata instead of using results cached in the last 24h",
+    )
     init_project_parser.set_defaults(func=init_project_command)
 
     # My command
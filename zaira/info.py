@@ -2,46 +2,240 @@
 
 import argparse
 import json
+import os
 import sys
-from typing import Callable, TypeVar
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple, TypeVar
 
 from zaira.jira_client import (
-    get_jira,
     get_schema_path,
     get_project_schema_path,
+    get_discovery_cache_path,
     CACHE_DIR,
 )
-from zaira.types import ProjectSchema, ZSchema
+from zaira.types import ProjectDiscovery, ProjectSchema, ZSchema
+
+if TYPE_CHECKING:
+    from jira import JIRA
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 T = TypeVar("T")
 
 
+def _dump_json(data: dict) -> bytes:
+    """Serialize cache data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _load_json(data: bytes) -> dict:
+    """Decode cache file bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _schema_ttl() -> float:
+    """Seconds a parsed schema is trusted without re-checking the file.
+
+    Off by default so CLI runs always see the latest cache file; long-lived
+    importers can opt in with ZAIRA_SCHEMA_TTL.
+    """
+    try:
+        return max(0.0, float(os.environ.get("ZAIRA_SCHEMA_TTL", "0")))
+    except ValueError:
+        return 0.0
+
+
+_SCHEMA_TTL = _schema_ttl()
+
+# Parsed instance schemas for this process:
+# path -> (mtime_ns, size, checked_at, schema)
+_SCHEMA_CACHE: dict[Path, tuple[int, int, float, ZSchema]] = {}
+
+
+def _read_schema(schema_file: Path, ttl: float | None = None) -> ZSchema | None:
+    """Read a schema file, reusing the parsed result while the file is unchanged.
+
+    The returned dict is shared with the cache and must not be mutated.
+    Within ttl seconds (default _SCHEMA_TTL) of the last check the file is
+    not even stat()ed; pass 0 to always validate against the file.
+    """
+    if ttl is None:
+        ttl = _SCHEMA_TTL
+    cached = _SCHEMA_CACHE.get(schema_file)
+    now = time.monotonic()
+    if cached and now - cached[2] < ttl:
+        return cached[3]
+    try:
+        st = schema_file.stat()
+    except FileNotFoundError:
+        return None
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        schema = cached[3]
+    else:
+        schema = _load_json(schema_file.read_bytes())
+    _SCHEMA_CACHE[schema_file] = (st.st_mtime_ns, st.st_size, now, schema)
+    return schema
+
+
 def load_schema() -> ZSchema | None:
     """Load cached instance schema from global cache directory.
 
     Returns:
         Schema dict if found, None otherwise.
     """
-    schema_file = get_schema_path()
-    if not schema_file.exists():
+    schema = _read_schema(get_schema_path())
+    return dict(schema) if schema is not None else None
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds identical bytes.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def save_schema(schema: ZSchema, profile: str | None = None) -> None:
+    """Save instance schema to global cache directory.
+
+    Args:
+        schema: Instance schema
+        profile: Profile to save under (defaults to the current one)
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    schema_file = get_schema_path(profile)
+    if _write_if_changed(schema_file, _dump_json(schema)):
+        _SCHEMA_CACHE.pop(schema_file, None)
+        _load_field_index.cache_clear()
+
+
+def save_project_schema(
+    project: str, schema: ProjectSchema, profile: str | None = None
+) -> Path:
+    """Save project schema to global cache directory.
+
+    Args:
+        project: Project key
+        schema: Project schema
+        profile: Profile to save under (defaults to the current one)
+
+    Returns:
+        Path of the written project schema file.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    project_file = get_project_schema_path(project, profile)
+    _write_if_changed(project_file, _dump_json(schema))
+    return project_file
+
+
+# Seconds before cached init-project discovery results are fetched again
+DISCOVERY_TTL = 24 * 60 * 60
+
+
+def load_discovery_cache(
+    project: str, profile: str | None = None
+) -> ProjectDiscovery | None:
+    """Load cached discovery results for a project.
+
+    Args:
+        project: Project key
+        profile: Profile to read from (defaults to the current one)
+
+    Returns:
+        Discovery dict if cached within DISCOVERY_TTL, None otherwise.
+    """
+    cache_file = get_discovery_cache_path(project, profile)
+    try:
+        if time.time() - cache_file.stat().st_mtime > DISCOVERY_TTL:
+            return None
+        return _load_json(cache_file.read_bytes())
+    except (FileNotFoundError, ValueError):
         return None
-    return json.load(schema_file.open())
 
 
-def save_schema(schema: ZSchema) -> None:
-    """Save instance schema to global cache directory."""
+def save_discovery_cache(
+    project: str, discovery: ProjectDiscovery, profile: str | None = None
+) -> None:
+    """Save discovery results for a project to global cache directory.
+
+    Args:
+        project: Project key
+        discovery: Discovery results
+        profile: Profile to save under (defaults to the current one)
+    """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    schema_file = get_schema_path()
-    schema_file.write_text(json.dumps(schema, indent=2))
+    # Always rewrite: the file's mtime is what marks the results as fresh
+    get_discovery_cache_path(project, profile).write_bytes(_dump_json(discovery))
 
 
 def update_schema(key: str, value: dict | list) -> None:
     """Update a single key in the cached schema."""
+    update_schema_many({key: value})
+
+
+def update_schema_many(updates: dict[str, dict | list]) -> None:
+    """Update several keys in the cached schema with a single read and write."""
     schema = load_schema() or {}
-    schema[key] = value
+    schema.update(updates)
     save_schema(schema)
 
 
+class _FieldIndex(NamedTuple):
+    """Field lookup tables derived from one version of the cached schema."""
+
+    names: dict[str, str]  # field ID -> name
+    ids_by_name: dict[str, str]  # lowercased name -> field ID
+    types: dict[str, str]  # field ID -> type
+
+
+_EMPTY_FIELD_INDEX = _FieldIndex({}, {}, {})
+
+
+@lru_cache(maxsize=4)
+def _load_field_index(schema_file: Path, mtime_ns: int, size: int) -> _FieldIndex:
+    """Build field lookup tables for a given schema file version.
+
+    Keyed by (path, mtime, size) so edits to the cache file are picked up
+    without explicit invalidation. The TTL is bypassed so the tables are
+    built from the file version they are keyed on.
+    """
+    schema = _read_schema(schema_file, ttl=0) or {}
+    names = schema.get("fields") or {}
+    ids_by_name: dict[str, str] = {}
+    for field_id, field_name in names.items():
+        # First match wins, as with a linear scan
+        ids_by_name.setdefault(field_name.lower(), field_id)
+    return _FieldIndex(names, ids_by_name, schema.get("fieldTypes") or {})
+
+
+def _field_index() -> _FieldIndex:
+    """Get field lookup tables for the current cached schema."""
+    schema_file = get_schema_path()
+    try:
+        st = schema_file.stat()
+    except FileNotFoundError:
+        return _EMPTY_FIELD_INDEX
+    return _load_field_index(schema_file, st.st_mtime_ns, st.st_size)
+
+
 def get_field_id(name: str) -> str | None:
     """Look up field ID by name (reverse lookup).
 
@@ -51,14 +245,7 @@ def get_field_id(name: str) -> str | None:
     Returns:
         Field ID (e.g., "customfield_10001") or None if not found.
     """
-    schema = load_schema()
-    if not schema or "fields" not in schema:
-        return None
-    # Schema stores {id: name}, reverse it
-    for field_id, field_name in schema["fields"].items():
-        if field_name.lower() == name.lower():
-            return field_id
-    return None
+    return _field_index().ids_by_name.get(name.lower())
 
 
 def get_field_name(field_id: str) -> str | None:
@@ -70,10 +257,7 @@ def get_field_name(field_id: str) -> str | None:
     Returns:
         Human-readable name (e.g., "Epic Link") or None if not found.
     """
-    schema = load_schema()
-    if not schema or "fields" not in schema:
-        return None
-    return schema["fields"].get(field_id)
+    return _field_index().names.get(field_id)
 
 
 def get_field_map() -> dict[str, str]:
@@ -82,10 +266,7 @@ def get_field_map() -> dict[str, str]:
     Returns:
         Dict mapping field names to IDs.
     """
-    schema = load_schema()
-    if not schema or "fields" not in schema:
-        return {}
-    return {name: field_id for field_id, name in schema["fields"].items()}
+    return {name: field_id for field_id, name in _field_index().names.items()}
 
 
 def get_field_type(field_id: str) -> str | None:
@@ -97,10 +278,7 @@ def get_field_type(field_id: str) -> str | None:
     Returns:
         Field type (e.g., "option", "array", "string") or None if not found.
     """
-    schema = load_schema()
-    if not schema or "fieldTypes" not in schema:
-        return None
-    return schema["fieldTypes"].get(field_id)
+    return _field_index().types.get(field_id)
 
 
 def load_project_schema(project: str) -> ProjectSchema | None:
@@ -109,10 +287,11 @@ def load_project_schema(project: str) -> ProjectSchema | None:
     Returns:
         Project schema dict if found, None otherwise.
     """
-    schema_file = get_project_schema_path(project)
-    if not schema_file.exists():
+    try:
+        data = get_project_schema_path(project).read_bytes()
+    except FileNotFoundError:
         return None
-    return json.load(schema_file.open())
+    return _load_json(data)
 
 
 def _fetch_cached_data(
@@ -130,21 +309,89 @@ def _fetch_cached_data(
     Returns:
         Cached or freshly fetched data
     """
-    schema = load_schema()
+    schema = _read_schema(get_schema_path())
     if not refresh and schema and schema_key in schema:
         return schema[schema_key]
     return fetch_fn()
 
 
+def _fields_schema(fields: list[dict]) -> ZSchema:
+    """Build the fields/fieldTypes schema entries from raw Jira fields."""
+    return {
+        "fields": {f["id"]: f["name"] for f in fields},
+        # Store field types for select/option fields
+        "fieldTypes": {
+            f["id"]: field_type
+            for f in fields
+            if (field_type := (f.get("schema") or {}).get("type"))
+        },
+    }
+
+
+def _fetch_fields_schema(jira: "JIRA") -> ZSchema:
+    """Fetch field names and types."""
+    return _fields_schema(jira.fields())
+
+
+def _fetch_statuses_schema(jira: "JIRA") -> ZSchema:
+    """Fetch status names and their categories."""
+    statuses = jira.statuses()
+    # statusCategory is present on every status or on none, so probe once
+    if not statuses or not hasattr(statuses[0], "statusCategory"):
+        return {"statuses": {s.name: None for s in statuses}}
+    category = attrgetter("statusCategory.name")
+    return {"statuses": {s.name: category(s) for s in statuses}}
+
+
+def _fetch_priorities_schema(jira: "JIRA") -> ZSchema:
+    """Fetch priority names in order."""
+    return {"priorities": [p.name for p in jira.priorities()]}
+
+
+def _fetch_issue_types_schema(jira: "JIRA") -> ZSchema:
+    """Fetch issue type names and subtask flags."""
+    return {"issueTypes": {t.name: {"subtask": t.subtask} for t in jira.issue_types()}}
+
+
+def _fetch_link_types_schema(jira: "JIRA") -> ZSchema:
+    """Fetch link type names and their directions."""
+    return {
+        "linkTypes": {
+            t.name: {"outward": t.outward, "inward": t.inward}
+            for t in jira.issue_link_types()
+        }
+    }
+
+
+# (label, fetcher) pairs used to build the full instance schema
+_SCHEMA_FETCHERS: tuple[tuple[str, Callable[["JIRA"], ZSchema]], ...] = (
+    ("fields", _fetch_fields_schema),
+    ("statuses", _fetch_statuses_schema),
+    ("priorities", _fetch_priorities_schema),
+    ("issue types", _fetch_issue_types_schema),
+    ("link types", _fetch_link_types_schema),
+)
+
+
+def _refresh_schema(fetch: Callable[["JIRA"], ZSchema]) -> ZSchema:
+    """Fetch schema entries from Jira and merge them into the cache."""
+    from zaira.jira_client import get_jira
+
+    data = fetch(get_jira())
+    update_schema_many(data)
+    return data
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write command output with a single stdout write."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
 def link_types_command(args: argparse.Namespace) -> None:
     """List available link types."""
 
     def fetch_link_types():
-        jira = get_jira()
-        types = jira.issue_link_types()
-        data = {t.name: {"outward": t.outward, "inward": t.inward} for t in types}
-        update_schema("linkTypes", data)
-        return data
+        return _refresh_schema(_fetch_link_types_schema)["linkTypes"]
 
     try:
         link_types = _fetch_cached_data(
@@ -154,25 +401,18 @@ def link_types_command(args: argparse.Namespace) -> None:
         print(f"Error fetching link types: {e}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"{'Type':<20} {'Outward':<25} {'Inward':<25}")
-    print("-" * 70)
+    out = [f"{'Type':<20} {'Outward':<25} {'Inward':<25}", "-" * 70]
     for name in sorted(link_types.keys()):
         t = link_types[name]
-        print(f"{name:<20} {t['outward']:<25} {t['inward']:<25}")
+        out.append(f"{name:<20} {t['outward']:<25} {t['inward']:<25}")
+    _write_lines(out)
 
 
 def statuses_command(args: argparse.Namespace) -> None:
     """List available statuses."""
 
     def fetch_statuses():
-        jira = get_jira()
-        raw = jira.statuses()
-        data = {
-            s.name: s.statusCategory.name if hasattr(s, "statusCategory") else None
-            for s in raw
-        }
-        update_schema("statuses", data)
-        return data
+        return _refresh_schema(_fetch_statuses_schema)["statuses"]
 
     try:
         statuses = _fetch_cached_data(
@@ -182,22 +422,18 @@ def statuses_command(args: argparse.Namespace) -> None:
         print(f"Error fetching statuses: {e}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"{'Status':<30} {'Category':<20}")
-    print("-" * 50)
+    out = [f"{'Status':<30} {'Category':<20}", "-" * 50]
     for name in sorted(statuses.keys()):
         category = statuses[name] or "-"
-        print(f"{name:<30} {category:<20}")
+        out.append(f"{name:<30} {category:<20}")
+    _write_lines(out)
 
 
 def priorities_command(args: argparse.Namespace) -> None:
     """List available priorities."""
 
     def fetch_priorities():
-        jira = get_jira()
-        raw = jira.priorities()
-        data = [p.name for p in raw]
-        update_schema("priorities", data)
-        return data
+        return _refresh_schema(_fetch_priorities_schema)["priorities"]
 
     try:
         priorities = _fetch_cached_data(
@@ -207,20 +443,14 @@ def priorities_command(args: argparse.Namespace) -> None:
         print(f"Error fetching priorities: {e}", file=sys.stderr)
         sys.exit(1)
 
-    print("Priorities:")
-    for name in priorities:
-        print(f"  {name}")
+    _write_lines(["Priorities:", *(f"  {name}" for name in priorities)])
 
 
 def issue_types_command(args: argparse.Namespace) -> None:
     """List available issue types."""
 
     def fetch_issue_types():
-        jira = get_jira()
-        raw = jira.issue_types()
-        data = {t.name: {"subtask": t.subtask} for t in raw}
-        update_schema("issueTypes", data)
-        return data
+        return _refresh_schema(_fetch_issue_types_schema)["issueTypes"]
 
     try:
         issue_types = _fetch_cached_data(
@@ -230,68 +460,53 @@ def issue_types_command(args: argparse.Namespace) -> None:
         print(f"Error fetching issue types: {e}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"{'Type':<25} {'Subtask':<10}")
-    print("-" * 35)
+    out = [f"{'Type':<25} {'Subtask':<10}", "-" * 35]
     for name in sorted(issue_types.keys()):
         subtask = "yes" if issue_types[name]["subtask"] else "no"
-        print(f"{name:<25} {subtask:<10}")
+        out.append(f"{name:<25} {subtask:<10}")
+    _write_lines(out)
 
 
 def fields_command(args: argparse.Namespace) -> None:
     """List custom fields."""
 
     def fetch_fields():
-        jira = get_jira()
-        raw_fields = jira.fields()
-        update_schema("fields", {f["id"]: f["name"] for f in raw_fields})
-        update_schema(
-            "fieldTypes",
-            {
-                f["id"]: f.get("schema", {}).get("type")
-                for f in raw_fields
-                if f.get("schema", {}).get("type")
-            },
-        )
-        return raw_fields
-
-    refresh = getattr(args, "refresh", False)
-    schema = load_schema()
+        return _refresh_schema(_fetch_fields_schema)["fields"]
 
-    # fields_command needs special handling: cache stores {id: name} but we need list
-    if not refresh and schema and "fields" in schema:
-        fields = [{"id": k, "name": v} for k, v in schema["fields"].items()]
-    else:
-        try:
-            fields = fetch_fields()
-        except Exception as e:
-            print(f"Error fetching fields: {e}", file=sys.stderr)
-            sys.exit(1)
+    try:
+        fields = _fetch_cached_data(
+            "fields", fetch_fields, getattr(args, "refresh", False)
+        )
+    except Exception as e:
+        print(f"Error fetching fields: {e}", file=sys.stderr)
+        sys.exit(1)
 
     # Filter to custom fields only (unless --all)
     show_all = getattr(args, "all", False)
     filter_text = getattr(args, "filter", None)
 
     if show_all:
-        result = fields
+        result = list(fields.items())
     else:
         result = [
-            f for f in fields if f.get("custom") or f["id"].startswith("customfield_")
+            (field_id, name)
+            for field_id, name in fields.items()
+            if field_id.startswith("customfield_")
         ]
 
     if filter_text:
         filter_lower = filter_text.lower()
         result = [
-            f
-            for f in result
-            if filter_lower in f["name"].lower() or filter_lower in f["id"].lower()
+            (field_id, name)
+            for field_id, name in result
+            if filter_lower in name.lower() or filter_lower in field_id.lower()
         ]
 
-    result = sorted(result, key=lambda x: x["name"].lower())
+    result.sort(key=lambda f: f[1].lower())
 
-    print(f"{'ID':<25} {'Name':<40}")
-    print("-" * 65)
-    for f in result:
-        print(f"{f['id']:<25} {f['name']:<40}")
+    out = [f"{'ID':<25} {'Name':<40}", "-" * 65]
+    out.extend(f"{field_id:<25} {name:<40}" for field_id, name in result)
+    _write_lines(out)
 
 
 def components_command(args: argparse.Namespace) -> None:
@@ -309,9 +524,8 @@ def components_command(args: argparse.Namespace) -> None:
         print(f"No components found for {project}")
         return
 
-    print(f"Components for {project}:")
-    for comp in sorted(components):
-        print(f"  {comp}")
+    # Discovery stores components already sorted
+    _write_lines([f"Components for {project}:", *(f"  {comp}" for comp in components)])
 
 
 def labels_command(args: argparse.Namespace) -> None:
@@ -329,76 +543,45 @@ def labels_command(args: argparse.Namespace) -> None:
         print(f"No labels found for {project}")
         return
 
-    print(f"Labels for {project}:")
-    for label in sorted(labels):
-        print(f"  {label}")
+    # Discovery stores labels already sorted
+    _write_lines([f"Labels for {project}:", *(f"  {label}" for label in labels)])
 
 
 def fetch_and_save_schema(
     project: str | None = None,
     components: list[str] | None = None,
     labels: list[str] | None = None,
+    profile: str | None = None,
 ) -> None:
     """Fetch Jira instance metadata and save to global cache.
 
     Instance schema: ~/.cache/zaira/zschema_PROFILE.json
     Project schema: ~/.cache/zaira/zproject_PROFILE_PROJECT.json
+
+    PROFILE is the current one unless profile is given.
     """
+    from zaira.jira_client import get_jira
+
     jira = get_jira()
     schema: ZSchema = {}
 
-    print("Fetching fields...")
-    try:
-        fields = jira.fields()
-        schema["fields"] = {f["id"]: f["name"] for f in fields}
-        # Store field types for select/option fields
-        schema["fieldTypes"] = {
-            f["id"]: f.get("schema", {}).get("type")
-            for f in fields
-            if f.get("schema", {}).get("type")
-        }
-    except Exception as e:
-        print(f"  Warning: Could not fetch fields: {e}", file=sys.stderr)
-
-    print("Fetching statuses...")
-    try:
-        statuses = jira.statuses()
-        schema["statuses"] = {
-            s.name: s.statusCategory.name if hasattr(s, "statusCategory") else None
-            for s in statuses
-        }
-    except Exception as e:
-        print(f"  Warning: Could not fetch statuses: {e}", file=sys.stderr)
-
-    print("Fetching priorities...")
-    try:
-        priorities = jira.priorities()
-        schema["priorities"] = [p.name for p in priorities]
-    except Exception as e:
-        print(f"  Warning: Could not fetch priorities: {e}", file=sys.stderr)
-
-    print("Fetching issue types...")
-    try:
-        issue_types = jira.issue_types()
-        schema["issueTypes"] = {t.name: {"subtask": t.subtask} for t in issue_types}
-    except Exception as e:
-        print(f"  Warning: Could not fetch issue types: {e}", file=sys.stderr)
-
-    print("Fetching link types...")
-    try:
-        link_types = jira.issue_link_types()
-        schema["linkTypes"] = {
-            t.name: {"outward": t.outward, "inward": t.inward} for t in link_types
-        }
-    except Exception as e:
-        print(f"  Warning: Could not fetch link types: {e}", file=sys.stderr)
+    # The metadata endpoints are independent, so fetch them concurrently.
+    # Results are merged in a fixed order to keep output deterministic.
+    with ThreadPoolExecutor(max_workers=len(_SCHEMA_FETCHERS)) as executor:
+        futures = [
+            (label, executor.submit(fetch, jira)) for label, fetch in _SCHEMA_FETCHERS
+        ]
 
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for label, future in futures:
+        print(f"Fetching {label}...")
+        try:
+            schema.update(future.result())
+        except Exception as e:
+            print(f"  Warning: Could not fetch {label}: {e}", file=sys.stderr)
 
     # Save instance schema
-    schema_file = get_schema_path()
-    schema_file.write_text(json.dumps(schema, indent=2))
-    print(f"Saved instance schema to {schema_file}")
+    save_schema(schema, profile)
+    print(f"Saved instance schema to {get_schema_path(profile)}")
 
     # Save project schema if provided
     if project and (components is not None or labels is not None):
@@ -407,8 +590,7 @@ def fetch_and_save_schema(
             project_schema["components"] = components
         if labels is not None:
             project_schema["labels"] = labels
-        project_file = get_project_schema_path(project)
-        project_file.write_text(json.dumps(project_schema, indent=2))
+        project_file = save_project_schema(project, project_schema, profile)
         print(f"Saved project schema to {project_file}")
 
 
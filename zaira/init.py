@@ -1,75 +1,91 @@
 """Initialize project configuration."""
 
 import argparse
-import json
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
 
 from zaira.jira_client import (
-    CACHE_DIR,
     CREDENTIALS_FILE,
-    get_jira,
+    DEFAULT_PROFILE,
     get_jira_site,
-    get_project_schema_path,
     load_credentials,
 )
-from zaira.info import fetch_and_save_schema
+from zaira.info import (
+    fetch_and_save_schema,
+    load_discovery_cache,
+    save_discovery_cache,
+    save_project_schema,
+)
+from zaira.types import BoardSummary, ProjectDiscovery
 
 
 def discover_components(project: str) -> list[str]:
     """Discover components for a project."""
+    from zaira.jira_client import get_jira
+
     jira = get_jira()
     try:
-        proj = jira.project(project)
-        components = jira.project_components(proj)
-        return sorted([c.name for c in components if c.name])
+        # project_components accepts the key directly; no need to fetch
+        # the project resource first
+        components = jira.project_components(project)
+        return sorted(c.name for c in components if c.name)
     except Exception:
         return []
 
 
 def discover_labels(project: str) -> list[str]:
     """Discover labels used in a project by sampling recent tickets."""
+    from zaira.jira_client import get_jira
+
     jira = get_jira()
     try:
-        issues = jira.search_issues(
-            f"project = {project} ORDER BY updated DESC",
-            maxResults=200,
+        # Only labelled issues and only the labels field are needed; skip
+        # building Issue objects. With json_result this is a single request;
+        # servers that cap the page size just return a smaller sample.
+        result = jira.search_issues(
+            f"project = {project} AND labels IS NOT EMPTY ORDER BY updated DESC",
+            maxResults=500,
+            fields="labels",
+            json_result=True,
         )
         labels = set()
-        for issue in issues:
-            for label in issue.fields.labels or []:
-                labels.add(label)
+        for issue in result.get("issues", []):
+            labels.update(issue.get("fields", {}).get("labels") or [])
         return sorted(labels)
     except Exception:
         return []
 
 
-def discover_boards(project: str) -> list[dict]:
+def discover_boards(project: str) -> list[BoardSummary]:
     """Discover boards for a project."""
+    from zaira.jira_client import get_jira
+
     jira = get_jira()
     try:
         boards = jira.boards(projectKeyOrID=project)
-        return [
-            {
-                "id": b.id,
-                "name": b.name,
-                "type": b.type,
-            }
-            for b in boards
-        ]
+        return [BoardSummary(b.id, b.name, b.type) for b in boards]
     except Exception:
         return []
 
 
+# Spaces become hyphens, parentheses are dropped
+_SLUG_TABLE = str.maketrans({" ": "-", "(": None, ")": None})
+
+
+@lru_cache(maxsize=1024)
 def slugify(name: str) -> str:
     """Convert name to slug for config keys."""
-    return name.lower().replace(" ", "-").replace("(", "").replace(")", "")
+    return name.lower().translate(_SLUG_TABLE)
 
 
 def generate_config(
     projects: list[str],
     site: str,
-    all_boards: dict[str, list[dict]],
+    all_boards: dict[str, list[BoardSummary]],
     all_components: dict[str, list[str]],
 ) -> str:
     """Generate zproject.toml content.
@@ -80,101 +96,123 @@ def generate_config(
         all_boards: Dict mapping project key to list of boards
         all_components: Dict mapping project key to list of components
     """
-    lines = ["[project]", f'site = "{site}"', ""]
+    buf = io.StringIO()
+    write_config(buf, projects, site, all_boards, all_components)
+    return buf.getvalue()
+
+
+def write_config(
+    fp: TextIO,
+    projects: list[str],
+    site: str,
+    all_boards: dict[str, list[BoardSummary]],
+    all_components: dict[str, list[str]],
+) -> None:
+    """Write zproject.toml content to an open text stream.
+
+    Args:
+        fp: Text stream to write to
+        projects: List of project keys
+        site: Jira site URL
+        all_boards: Dict mapping project key to list of boards
+        all_components: Dict mapping project key to list of components
+    """
+    w = fp.write
+    # Config key prefix per project - only needed to disambiguate multiple projects
+    prefixes = {p: f"{p.lower()}-" if len(projects) > 1 else "" for p in projects}
+
+    w(f'[project]\nsite = "{site}"\n\n')
 
     # Boards - collect from all projects
-    lines.append("[boards]")
+    w("[boards]\n")
     has_boards = False
     for project in projects:
         boards = all_boards.get(project, [])
         for board in boards:
             has_boards = True
-            lines.append(f"# {board['name']} ({board['type']})")
-            lines.append(f"{slugify(board['name'])} = {board['id']}")
+            w(f"# {board.name} ({board.type})\n{slugify(board.name)} = {board.id}\n")
     if not has_boards:
-        lines.append("# No boards found")
-        lines.append("# kanban = 1789")
-    lines.append("")
+        w("# No boards found\n# kanban = 1789\n")
+    w("\n")
 
     # Queries - per project
-    lines.append("[queries]")
-    lines.append("# Named JQL queries for quick access")
+    w("[queries]\n")
+    w("# Named JQL queries for quick access\n")
     project_list = ", ".join(projects)
-    lines.append(
-        f'my-tickets = "assignee = currentUser() AND project IN ({project_list}) AND status NOT IN (Done, Disposal)"'
+    w(
+        f'my-tickets = "assignee = currentUser() AND project IN ({project_list}) AND status NOT IN (Done, Disposal)"\n'
     )
     for project in projects:
-        prefix = f"{project.lower()}-" if len(projects) > 1 else ""
-        lines.append(
-            f'# {prefix}bugs = "project = {project} AND type = Bug AND status != Done"'
+        w(
+            f'# {prefixes[project]}bugs = "project = {project} AND type = Bug AND status != Done"\n'
         )
-    lines.append("")
+    w("\n")
 
     # Reports - named report definitions
-    lines.append("[reports]")
-    lines.append('my-tickets = { query = "my-tickets", group_by = "status" }')
+    w("[reports]\n")
+    w('my-tickets = { query = "my-tickets", group_by = "status" }\n')
 
     for project in projects:
-        prefix = f"{project.lower()}-" if len(projects) > 1 else ""
+        prefix = prefixes[project]
         boards = all_boards.get(project, [])
         if boards:
             board = boards[0]
-            lines.append(
-                f'{slugify(board["name"])} = {{ board = {board["id"]}, group_by = "status" }}'
+            w(
+                f'{slugify(board.name)} = {{ board = {board.id}, group_by = "status" }}\n'
             )
+        # Everything up to the component name is the same for each component
+        component_jql = f'{{ jql = "project = {project} AND component = \\"'
         components = all_components.get(project, [])
-        for comp in components:
-            lines.append(
-                f'{prefix}{slugify(comp)} = {{ jql = "project = {project} AND component = \\"{comp}\\"", group_by = "status" }}'
+        w(
+            "".join(
+                f'{prefix}{slug} = {component_jql}{comp}\\"", group_by = "status" }}\n'
+                for comp, slug in zip(components, map(slugify, components))
             )
-        lines.append(
-            f'# {prefix}bugs = {{ jql = "project = {project} AND type = Bug", group_by = "priority" }}'
         )
-    lines.append("")
+        w(
+            f'# {prefix}bugs = {{ jql = "project = {project} AND type = Bug", group_by = "priority" }}\n'
+        )
 
-    return "\n".join(lines)
+
+_CREDENTIALS_TEMPLATE = """# Jira credentials
+# Get your API token from: https://id.atlassian.com/manage-profile/security/api-tokens
+
+site = "your-company.atlassian.net"
+email = "your-email@example.com"
+api_token = "your-api-token"
+"""
+
+_EDIT_CREDENTIALS_HELP = """Please edit this file with your Jira credentials:
+  1. Set your Jira site (e.g., company.atlassian.net)
+  2. Set your email address
+  3. Add your API token from https://id.atlassian.com/manage-profile/security/api-tokens"""
+
+
+_REQUIRED_CREDENTIALS = ("site", "email", "api_token")
 
 
 def check_credentials() -> bool:
     """Check if credentials are configured."""
     creds = load_credentials()
-    return bool(creds.get("site") and creds.get("email") and creds.get("api_token"))
+    return all(creds.get(key) for key in _REQUIRED_CREDENTIALS)
 
 
 def setup_credentials() -> None:
     """Create or prompt to edit credentials file."""
     if CREDENTIALS_FILE.exists():
         # File exists but has invalid/placeholder values
-        print(f"Credentials file exists but is not configured: {CREDENTIALS_FILE}\n")
-        print("Please edit this file with your Jira credentials:")
-        print("  1. Set your Jira site (e.g., company.atlassian.net)")
-        print("  2. Set your email address")
-        print(
-            "  3. Add your API token from https://id.atlassian.com/manage-profile/security/api-tokens"
-        )
+        status = f"Credentials file exists but is not configured: {CREDENTIALS_FILE}"
     else:
         # Create template
         CREDENTIALS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-        template = """# Jira credentials
-# Get your API token from: https://id.atlassian.com/manage-profile/security/api-tokens
-
-site = "your-company.atlassian.net"
-email = "your-email@example.com"
-api_token = "your-api-token"
-"""
-        CREDENTIALS_FILE.write_text(template)
+        CREDENTIALS_FILE.write_text(_CREDENTIALS_TEMPLATE)
         CREDENTIALS_FILE.chmod(0o600)
 
-        print(f"Created {CREDENTIALS_FILE}\n")
-        print("Please edit this file with your Jira credentials:")
-        print("  1. Set your Jira site (e.g., company.atlassian.net)")
-        print("  2. Set your email address")
-        print(
-            "  3. Add your API token from https://id.atlassian.com/manage-profile/security/api-tokens"
-        )
+        status = f"Created {CREDENTIALS_FILE}"
 
-    print("\nThen run 'zaira init' again.")
+    sys.stdout.write(
+        f"{status}\n\n{_EDIT_CREDENTIALS_HELP}\n\nThen run 'zaira init' again.\n"
+    )
 
 
 def init_command(args: argparse.Namespace) -> None:
@@ -209,41 +247,80 @@ def init_project_command(args: argparse.Namespace) -> None:
         print("Usage: zaira init-project PROJECT [PROJECT ...]")
         sys.exit(1)
 
-    # Discover metadata for all projects
-    all_boards: dict[str, list[dict]] = {}
-    all_components: dict[str, list[str]] = {}
-    all_labels: dict[str, list[str]] = {}
+    # The generated config names no profile, so everything cached here
+    # belongs to the default one, even when --force replaces a config that
+    # selects another
+    profile = DEFAULT_PROFILE
+
+    # Discover metadata for all projects, reusing recent results unless
+    # --refresh is given
+    discovered: dict[str, ProjectDiscovery] = {}
+    if not args.refresh:
+        for project in projects:
+            cached = load_discovery_cache(project, profile)
+            if cached is not None:
+                discovered[project] = cached
+    cached_projects = set(discovered)
+    to_discover = [p for p in projects if p not in cached_projects]
+
+    # Discovery calls are independent network round-trips, so run them
+    # concurrently, overlapped with the instance schema fetch. Warm the shared
+    # client first so threads reuse it.
+    from zaira.jira_client import get_jira
+
+    get_jira()
+    if to_discover:
+        print(f"Discovering {', '.join(to_discover)}...")
+    with ThreadPoolExecutor(max_workers=min(16, 3 * len(to_discover) + 1)) as executor:
+        schema_future = executor.submit(fetch_and_save_schema, profile=profile)
+        futures = {
+            project: (
+                executor.submit(discover_components, project),
+                executor.submit(discover_labels, project),
+                executor.submit(discover_boards, project),
+            )
+            for project in to_discover
+        }
 
+    for project, (components, labels, boards) in futures.items():
+        discovery: ProjectDiscovery = {
+            "components": components.result(),
+            "labels": labels.result(),
+            "boards": [board._asdict() for board in boards.result()],
+        }
+        discovered[project] = discovery
+        # Discovery swallows errors, so an all-empty result may be a failed
+        # lookup; don't pin it for a day
+        if any(discovery.values()):
+            save_discovery_cache(project, discovery, profile)
+
+    all_boards = {
+        p: [BoardSummary(**board) for board in discovered[p]["boards"]]
+        for p in projects
+    }
+    all_components = {p: discovered[p]["components"] for p in projects}
+    all_labels = {p: discovered[p]["labels"] for p in projects}
     for project in projects:
-        print(f"Discovering {project}...")
-
-        print("  Finding components...")
-        components = discover_components(project)
-        all_components[project] = components
-        print(f"    Found {len(components)} components")
-
-        print("  Finding labels...")
-        labels = discover_labels(project)
-        all_labels[project] = labels
-        print(f"    Found {len(labels)} labels")
-
-        print("  Finding boards...")
-        boards = discover_boards(project)
-        all_boards[project] = boards
-        print(f"    Found {len(boards)} boards")
+        suffix = (
+            " (cached, use --refresh to re-fetch)" if project in cached_projects else ""
+        )
+        print(
+            f"  {project}: {len(all_components[project])} components, "
+            f"{len(all_labels[project])} labels, {len(all_boards[project])} boards"
+            f"{suffix}"
+        )
 
-    content = generate_config(projects, site, all_boards, all_components)
-    config_path.write_text(content)
+    with config_path.open("w") as fp:
+        write_config(fp, projects, site, all_boards, all_components)
     print(f"\nCreated {config_path}\n")
 
-    # Cache instance schema (once) and project metadata (per project)
-    fetch_and_save_schema()
+    # Instance schema was cached during discovery; surface any error from it
+    # now that the config is written. Then cache project metadata.
+    schema_future.result()
     for project in projects:
         project_schema = {
             "components": all_components.get(project, []),
             "labels": all_labels.get(project, []),
         }
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        project_file = get_project_schema_path(project)
-        project_file.write_text(json.dumps(project_schema, indent=2))
+        project_file = save_project_schema(project, project_schema, profile)
         print(f"Saved project schema to {project_file}")
@@ -4,22 +4,37 @@ import sys
 import tomllib
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jira import JIRA
 from platformdirs import user_cache_dir, user_config_dir
 
 from zaira.project import load_config
 from zaira.types import Credentials
 
+if TYPE_CHECKING:
+    from jira import JIRA
+
 CONFIG_DIR = Path(user_config_dir("zaira"))
 CACHE_DIR = Path(user_cache_dir("zaira"))
 CREDENTIALS_FILE = CONFIG_DIR / "credentials.toml"
 
+# Connections kept alive to the Jira host, sized for concurrent requests
+HTTP_POOL_SIZE = 32
+
+# Issues requested per page when paging through search results; the library
+# default of 100 turns large reports into many round-trips. Jira Cloud's
+# token-paged search ignores this and uses its own fixed page size.
+SEARCH_BATCH_SIZE = 500
+
+
+# Profile used when zproject.toml does not name one
+DEFAULT_PROFILE = "default"
+
 
 def get_profile() -> str:
     """Get current profile name from zproject.toml."""
     config = load_config()
-    return config.get("project", {}).get("profile", "default")
+    return config.get("project", {}).get("profile", DEFAULT_PROFILE)
 
 
 def get_schema_path(profile: str | None = None) -> Path:
@@ -42,8 +57,22 @@ def get_project_schema_path(project: str, profile: str | None = None) -> Path:
     return CACHE_DIR / f"zproject_{profile}_{project}.json"
 
 
+def get_discovery_cache_path(project: str, profile: str | None = None) -> Path:
+    """Get path to cached init-project discovery results for a project.
+
+    Discovery results are cached at ~/.cache/zaira/zdiscover_PROFILE_PROJECT.json.
+    """
+    if profile is None:
+        profile = get_profile()
+    return CACHE_DIR / f"zdiscover_{profile}_{project}.json"
+
+
+@lru_cache(maxsize=1)
 def get_server_from_config() -> str | None:
-    """Get Jira server URL from credentials or zproject.toml."""
+    """Get Jira server URL from credentials or zproject.toml.
+
+    Memoized for the life of the process; save_credentials() resets it.
+    """
     # First check credentials file
     creds = load_credentials()
     site = creds.get("site")
@@ -60,15 +89,24 @@ def get_server_from_config() -> str | None:
     return None
 
 
-def load_credentials() -> Credentials:
-    """Load credentials from $XDG_CONFIG_HOME/zaira/credentials.toml."""
-    if not CREDENTIALS_FILE.exists():
+@lru_cache(maxsize=1)
+def _read_credentials(path: Path) -> Credentials:
+    """Parse a credentials file once per process.
+
+    The returned dict is shared with the cache and must not be mutated.
+    """
+    if not path.exists():
         return {}
 
-    with open(CREDENTIALS_FILE, "rb") as f:
+    with open(path, "rb") as f:
         return tomllib.load(f)
 
 
+def load_credentials() -> Credentials:
+    """Load credentials from $XDG_CONFIG_HOME/zaira/credentials.toml."""
+    return dict(_read_credentials(CREDENTIALS_FILE))
+
+
 def save_credentials(email: str, api_token: str) -> None:
     """Save credentials to $XDG_CONFIG_HOME/zaira/credentials.toml."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -78,12 +116,18 @@ def save_credentials(email: str, api_token: str) -> None:
 
     # Secure the file
     CREDENTIALS_FILE.chmod(0o600)
+    _read_credentials.cache_clear()
+    get_server_from_config.cache_clear()
+    get_jira_site.cache_clear()
+    get_credentials.cache_clear()
 
 
+@lru_cache(maxsize=1)
 def get_credentials() -> tuple[str, str, str]:
     """Get Jira credentials from config files.
 
     Server comes from zproject.toml, credentials from $XDG_CONFIG_HOME/zaira/credentials.toml.
+    Memoized for the life of the process; save_credentials() resets it.
 
     Returns:
         Tuple of (server_url, email, api_token)
@@ -104,10 +148,10 @@ def get_credentials() -> tuple[str, str, str]:
 
 
 # Injected client for testing
-_jira_client: JIRA | None = None
+_jira_client: "JIRA | None" = None
 
 
-def get_jira() -> JIRA:
+def get_jira() -> "JIRA":
     """Get the JIRA client instance (cached or injected).
 
     Returns:
@@ -120,17 +164,34 @@ def get_jira() -> JIRA:
 
 
 @lru_cache(maxsize=1)
-def _get_default_jira() -> JIRA:
+def _get_default_jira() -> "JIRA":
     """Create the default JIRA client from credentials.
 
     Returns:
         Authenticated JIRA client
     """
-    server, email, token = get_credentials()
-    return JIRA(server=server, basic_auth=(email, token))
+    # Deferred: the jira package (and requests) is slow to import and only
+    # needed once a command actually talks to Jira
+    from jira import JIRA
+    from jira.resources import Issue
+    from requests.adapters import HTTPAdapter
 
-
-def set_jira(client: JIRA | None) -> None:
+    server, email, token = get_credentials()
+    client = JIRA(
+        server=server,
+        basic_auth=(email, token),
+        default_batch_sizes={Issue: SEARCH_BATCH_SIZE},
+    )
+    # The default pool keeps 10 connections per host; concurrent discovery
+    # and schema fetches would otherwise queue and re-handshake TLS
+    client._session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE),
+    )
+    return client
+
+
+def set_jira(client: "JIRA | None") -> None:
     """Inject a JIRA client for testing. Pass None to reset."""
     global _jira_client
     _jira_client = client
@@ -149,8 +210,12 @@ def get_server_url() -> str:
     return server
 
 
+@lru_cache(maxsize=1)
 def get_jira_site() -> str:
-    """Get Jira site name (without https://)."""
+    """Get Jira site name (without https://).
+
+    Memoized for the life of the process; save_credentials() resets it.
+    """
     # First check credentials file
     creds = load_credentials()
     site = creds.get("site", "")
@@ -3,6 +3,7 @@
 import argparse
 import sys
 
+from zaira.info import load_schema
 from zaira.jira_client import get_jira, get_jira_site
 
 
@@ -12,6 +13,17 @@ def get_link_types() -> list[str]:
     return [lt.name for lt in jira.issue_link_types()]
 
 
+def _known_link_types() -> list[str]:
+    """Get link type names, from the cached schema when it has them.
+
+    Avoids a second round-trip after a failed create; falls back to the API.
+    """
+    schema = load_schema()
+    if schema and schema.get("linkTypes"):
+        return list(schema["linkTypes"])
+    return get_link_types()
+
+
 def create_link(from_key: str, to_key: str, link_type: str) -> bool:
     """Create a link between two Jira tickets.
 
@@ -32,7 +44,7 @@ def create_link(from_key: str, to_key: str, link_type: str) -> bool:
         if "No issue link type with name" in err:
             print(f"Error: Unknown link type '{link_type}'", file=sys.stderr)
             print("\nValid link types:", file=sys.stderr)
-            for name in sorted(get_link_types()):
+            for name in sorted(_known_link_types()):
                 print(f"  {name}", file=sys.stderr)
         else:
             print(f"Error creating link: {e}", file=sys.stderr)
@@ -1,15 +1,75 @@
 """Markdown conversion utilities."""
 
 import re
+import threading
 import xml.etree.ElementTree as ET
+from functools import partial
+from html import unescape
 from pathlib import Path
 
 import markdown
+from markdown.extensions import Extension
+from markdown.preprocessors import Preprocessor
 
 # Confluence namespace URIs
 AC_NS = "http://atlassian.com/content"
 RI_NS = "http://atlassian.com/resource/identifier"
 
+# Namespaced attribute keys as ElementTree stores them
+_AC_NAME = f"{{{AC_NS}}}name"
+_AC_ALT = f"{{{AC_NS}}}alt"
+_RI_FILENAME = f"{{{RI_NS}}}filename"
+
+# Patterns used on every conversion, compiled once
+_IMG_MD_RE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")  # ![alt](path)
+# Optional quoted title after an image path: ![alt](path "title")
+_IMG_TITLE_RE = re.compile(r"""\s+(?:"[^"]*"|'[^']*')\s*$""")
+# Backslash escapes the markdown library resolves in link targets
+_MD_ESCAPE_RE = re.compile(r"\\([\\`*_{}\[\]()>#+\-.!])")
+# MULTILINE so one search can also tell whether a document has any at all
+_LIST_INDENT_RE = re.compile(r"^( +)([-*+]|\d+\.) ", re.MULTILINE)
+_TOC_PLACEHOLDER = "<!--TOC_PLACEHOLDER-->"
+# Image references that point off-page and are never attachments
+_URL_PREFIXES = ("http://", "https://", "//")
+_ATTACHMENT_PREFIX = "attachment:"
+# Post-processing of the markdown library's HTML, in one scan: code blocks
+# (groups 1-2, as _code_block_to_macro expects), the TOC placeholder and
+# <img .../> tags
+_STORAGE_FIXUP_RE = re.compile(
+    r'<pre><code(?:\s+class="language-([^"]*)")?>(?P<code>.*?)</code></pre>'
+    r"|(?P<toc>(?:<p>)?<!--TOC_PLACEHOLDER-->(?:</p>)?)"
+    r"|<img\s+(?P<img>[^>]*)/>",
+    re.DOTALL,
+)
+_ALT_ATTR_RE = re.compile(r'alt="([^"]*)"')
+_SRC_ATTR_RE = re.compile(r'src="([^"]*)"')
+
+# Entities escaped by the markdown library inside code blocks. Unescaped in
+# one pass, so "&amp;lt;" correctly becomes "&lt;" rather than "<".
+_CODE_ENTITIES = {"&lt;": "<", "&gt;": ">", "&quot;": '"', "&amp;": "&"}
+_CODE_ENTITY_RE = re.compile("|".join(_CODE_ENTITIES))
+
+# HTML entities that Confluence emits but XML does not define. Declared in an
+# internal DTD so the parser expands them itself, in a single parse.
+_HTML_ENTITIES = {
+    "nbsp": "\u00a0",
+    "ldquo": "\u201c",
+    "rdquo": "\u201d",
+    "lsquo": "\u2018",
+    "rsquo": "\u2019",
+    "mdash": "\u2014",
+    "ndash": "\u2013",
+    "hellip": "\u2026",
+}
+_STORAGE_DOCTYPE = (
+    "<!DOCTYPE root ["
+    + "".join(f'<!ENTITY {name} "&#{ord(ch)};">' for name, ch in _HTML_ENTITIES.items())
+    + "]>"
+)
+
+# Root element wrapped around storage content, declaring its namespaces
+_STORAGE_ROOT_OPEN = f'<root xmlns:ac="{AC_NS}" xmlns:ri="{RI_NS}">'
+
 
 def extract_local_images(md_content: str) -> list[tuple[str, str]]:
     """Extract local image references from markdown.
@@ -21,16 +81,44 @@ def extract_local_images(md_content: str) -> list[tuple[str, str]]:
         List of (alt_text, image_path) tuples for local images only
     """
     # Pattern: ![alt](path) - but not URLs
-    pattern = r"!\[([^\]]*)\]\(([^)]+)\)"
+    if "![" not in md_content:
+        return []
     images = []
-    for match in re.finditer(pattern, md_content):
-        alt, path = match.group(1), match.group(2)
+    for match in _IMG_MD_RE.finditer(md_content):
+        alt, path = match.group(1), _image_path(match.group(2))
         # Skip URLs (http://, https://, //)
-        if not path.startswith(("http://", "https://", "//")):
+        if not path.startswith(_URL_PREFIXES):
             images.append((alt, path))
     return images
 
 
+def _image_path(target: str) -> str:
+    """Return the path of an image link target the way markdown reads it.
+
+    Drops an optional quoted title and <...> brackets and resolves backslash
+    escapes, so the result matches the rendered <img src>.
+    """
+    target = target.strip()
+    if target.endswith(("'", '"')):
+        target = _IMG_TITLE_RE.sub("", target)
+    if target.startswith("<") and target.endswith(">"):
+        target = target[1:-1]
+    if "\\" in target:
+        target = _MD_ESCAPE_RE.sub(r"\1", target)
+    return target
+
+
+def _filename(path: str) -> str:
+    """Return the final component of a local image path, like Path.name."""
+    # Plain "dir/file.png" paths need only a split; leave anything with
+    # separators or components Path treats specially to pathlib
+    if "\\" not in path and ":" not in path:
+        name = path.rpartition("/")[2]
+        if name and name != ".":
+            return name
+    return Path(path).name
+
+
 def convert_images_to_attachments(md_content: str) -> str:
     """Convert markdown image syntax to Confluence attachment references.
 
@@ -39,18 +127,21 @@ def convert_images_to_attachments(md_content: str) -> str:
 
     The actual file upload happens separately.
     """
+    if "![" not in md_content:
+        return md_content
+    return _IMG_MD_RE.sub(_image_to_attachment, md_content)
 
-    def replace_image(match: re.Match) -> str:
-        alt = match.group(1)
-        path = match.group(2)
-        # Skip URLs
-        if path.startswith(("http://", "https://", "//")):
-            return match.group(0)
-        # Use just the filename for attachment reference
-        filename = Path(path).name
-        return f"![{alt}](attachment:{filename})"
 
-    return re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", replace_image, md_content)
+def _image_to_attachment(match: re.Match) -> str:
+    """Rewrite one local ![alt](path) reference to ![alt](attachment:name)."""
+    alt = match.group(1)
+    path = match.group(2)
+    # Skip URLs
+    if path.startswith(_URL_PREFIXES):
+        return match.group(0)
+    # Use just the filename for attachment reference
+    filename = _filename(path)
+    return f"![{alt}](attachment:{filename})"
 
 
 def convert_attachments_to_images(md_content: str, image_dir: str = "./images") -> str:
@@ -59,16 +150,18 @@ def convert_attachments_to_images(md_content: str, image_dir: str = "./images")
     Converts: ![alt](attachment:foo.png)
     To: ![alt](./images/foo.png)
     """
+    if "![" not in md_content:
+        return md_content
 
     def replace_attachment(match: re.Match) -> str:
         alt = match.group(1)
         path = match.group(2)
-        if path.startswith("attachment:"):
-            filename = path[len("attachment:") :]
+        if path.startswith(_ATTACHMENT_PREFIX):
+            filename = path[len(_ATTACHMENT_PREFIX) :]
             return f"![{alt}]({image_dir}/{filename})"
         return match.group(0)
 
-    return re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", replace_attachment, md_content)
+    return _IMG_MD_RE.sub(replace_attachment, md_content)
 
 
 # Map markdown language names to Confluence code macro languages
@@ -99,6 +192,10 @@ LANG_MAP_REVERSE = {
 }
 
 
+def _unescape_code_entity(match: re.Match) -> str:
+    return _CODE_ENTITIES[match.group(0)]
+
+
 def _code_block_to_macro(match: re.Match) -> str:
     """Convert HTML code block to Confluence code macro."""
     lang = match.group(1) or ""
@@ -108,12 +205,8 @@ def _code_block_to_macro(match: re.Match) -> str:
     lang = LANG_MAP.get(lang.lower(), lang.lower()) if lang else "none"
 
     # Unescape HTML entities in code content
-    code = (
-        code.replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&quot;", '"')
-        .replace("&amp;", "&")  # Must be last
-    )
+    if "&" in code:
+        code = _CODE_ENTITY_RE.sub(_unescape_code_entity, code)
 
     return (
         f'<ac:structured-macro ac:name="code">'
@@ -123,26 +216,16 @@ def _code_block_to_macro(match: re.Match) -> str:
     )
 
 
-def _macro_to_code_block(match: re.Match) -> str:
-    """Convert Confluence code macro to markdown fenced code block."""
-    lang = match.group(1) or ""
-    code = match.group(2)
-
-    # Normalize language name back to markdown conventions
-    lang = LANG_MAP_REVERSE.get(lang.lower(), lang.lower())
-
-    # Remove trailing newline if present (will be added by fence)
-    code = code.rstrip("\n")
-
-    return f"\n```{lang}\n{code}\n```\n"
-
-
 def _normalize_list_indent(md_content: str) -> str:
     """Convert 2-space list indents to 4-space for markdown parser.
 
     The Python markdown library requires 4-space indentation for nested lists.
     This preprocessor allows users to write with 2-space indents.
     """
+    # Only indented list items are ever rewritten; most documents have none
+    if not _LIST_INDENT_RE.search(md_content):
+        return md_content
+
     lines = md_content.split("\n")
     result = []
     in_code_block = False
@@ -158,20 +241,61 @@ def _normalize_list_indent(md_content: str) -> str:
             result.append(line)
             continue
 
+        # Only space-indented lines can be nested list items; skip the regex
+        # for everything else
+        if not line.startswith(" "):
+            result.append(line)
+            continue
+
         # Match list items with leading whitespace
         # Pattern: leading spaces + list marker (-, *, +, or number.)
-        match = re.match(r"^( +)([-*+]|\d+\.) ", line)
+        match = _LIST_INDENT_RE.match(line)
         if match:
-            indent = match.group(1)
-            # Double the indent (2 -> 4, 4 -> 8, etc.)
-            new_indent = indent * 2
-            result.append(new_indent + line[len(indent) :])
+            # Double the indent (2 -> 4, 4 -> 8, etc.) by prepending it again
+            result.append(match.group(1) + line)
         else:
             result.append(line)
 
     return "\n".join(result)
 
 
+class _TocPreprocessor(Preprocessor):
+    """Replace [TOC] lines with a placeholder the HTML fixup turns into the macro."""
+
+    def run(self, lines: list[str]) -> list[str]:
+        return [_TOC_PLACEHOLDER if line == "[TOC]" else line for line in lines]
+
+
+class _TocExtension(Extension):
+    def extendMarkdown(self, md: markdown.Markdown) -> None:
+        # After fenced code blocks are stashed, so a [TOC] line inside one
+        # stays literal, and before raw HTML blocks are, so the placeholder
+        # comment passes through untouched
+        md.preprocessors.register(_TocPreprocessor(md), "zaira_toc", 22)
+
+
+_MD_EXTENSIONS = [
+    "tables",
+    "fenced_code",
+    "sane_lists",
+    _TocExtension(),
+]
+_md_local = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Return this thread's Markdown converter, creating it on first use.
+
+    Loading the extensions is most of the setup cost of a conversion, so the
+    instance is reused (after reset()). Markdown objects keep per-document
+    state, hence one per thread.
+    """
+    md = getattr(_md_local, "md", None)
+    if md is None:
+        md = _md_local.md = markdown.Markdown(extensions=_MD_EXTENSIONS)
+    return md
+
+
 def markdown_to_storage(md_content: str, convert_local_images: bool = True) -> str:
     """Convert Markdown to Confluence storage format.
 
@@ -182,75 +306,93 @@ def markdown_to_storage(md_content: str, convert_local_images: bool = True) -> s
     Returns:
         HTML suitable for Confluence storage format
     """
-    # Convert local images to attachment references before processing
-    if convert_local_images:
-        md_content = convert_images_to_attachments(md_content)
-
     # Normalize 2-space list indents to 4-space
     md_content = _normalize_list_indent(md_content)
 
-    # Convert [TOC] marker before markdown processing
-    md_content = re.sub(
-        r"^\[TOC\]$",
-        "<!--TOC_PLACEHOLDER-->",
-        md_content,
-        flags=re.MULTILINE,
-    )
+    html = _get_markdown().reset().convert(md_content)
+
+    # Nothing to post-process unless there are code blocks, a TOC or images.
+    # Local images become attachment references here too, in the same scan.
+    # Only paths extract_local_images reports are converted, so every
+    # attachment referenced is one that gets uploaded; a raw HTML <img> with
+    # some other local src is left as is.
+    if "<pre>" in html or "<img" in html or _TOC_PLACEHOLDER in html:
+        fixup = _fixup_storage_html
+        if convert_local_images and "<img" in html:
+            local_images = {path for _, path in extract_local_images(md_content)}
+            if local_images:
+                fixup = partial(_fixup_storage_html, local_images=local_images)
+        html = _STORAGE_FIXUP_RE.sub(fixup, html)
+    return html
 
-    extensions = [
-        "tables",
-        "fenced_code",
-        "sane_lists",
-    ]
-    html = markdown.markdown(md_content, extensions=extensions)
-
-    # Convert <pre><code class="language-X">...</code></pre> to Confluence code macro
-    html = re.sub(
-        r'<pre><code(?:\s+class="language-([^"]*)")?>(.*?)</code></pre>',
-        _code_block_to_macro,
-        html,
-        flags=re.DOTALL,
-    )
 
-    # Convert TOC placeholder to Confluence TOC macro
-    html = re.sub(
-        r"(<p>)?<!--TOC_PLACEHOLDER-->(</p>)?",
-        '<ac:structured-macro ac:name="toc"/>',
-        html,
-    )
+def _fixup_storage_html(
+    match: re.Match, local_images: set[str] | frozenset[str] = frozenset()
+) -> str:
+    """Convert one markdown HTML construct to its Confluence equivalent.
+
+    Args:
+        match: _STORAGE_FIXUP_RE match
+        local_images: Local image paths to turn into attachment references
+    """
+    # <pre><code class="language-X">...</code></pre> -> Confluence code macro
+    if match.group("code") is not None:
+        return _code_block_to_macro(match)
+
+    # TOC placeholder -> Confluence TOC macro
+    if match.group("toc") is not None:
+        return '<ac:structured-macro ac:name="toc"/>'
 
-    # Convert attachment images to Confluence attachment macro
     # <img alt="..." src="attachment:filename.png" /> -> <ac:image><ri:attachment ri:filename="..."/></ac:image>
-    def img_to_attachment(match: re.Match) -> str:
-        attrs = match.group(1)
-        alt_match = re.search(r'alt="([^"]*)"', attrs)
-        src_match = re.search(r'src="attachment:([^"]*)"', attrs)
-        if src_match:
-            filename = src_match.group(1)
-            alt = alt_match.group(1) if alt_match else ""
-            alt_attr = f' ac:alt="{alt}"' if alt else ""
-            return f'<ac:image{alt_attr}><ri:attachment ri:filename="{filename}"/></ac:image>'
+    # Paths in local_images are referenced by file name:
+    # <img src="./images/foo.png" /> -> ri:filename="foo.png"
+    attrs = match.group("img")
+    src_match = _SRC_ATTR_RE.search(attrs)
+    if not src_match:
         return match.group(0)
+    src = src_match.group(1)
+    if src.startswith(_ATTACHMENT_PREFIX):
+        filename = src[len(_ATTACHMENT_PREFIX) :]
+    elif local_images and (unescape(src) if "&" in src else src) in local_images:
+        filename = _filename(src)
+    else:
+        return match.group(0)
+    alt_match = _ALT_ATTR_RE.search(attrs)
+    alt = alt_match.group(1) if alt_match else ""
+    alt_attr = f' ac:alt="{alt}"' if alt else ""
+    return f'<ac:image{alt_attr}><ri:attachment ri:filename="{filename}"/></ac:image>'
+
+
+# Header tag -> markdown prefix
+_HEADER_LEVELS = {
+    "h1": "#",
+    "h2": "##",
+    "h3": "###",
+    "h4": "####",
+    "h5": "#####",
+    "h6": "######",
+}
 
-    html = re.sub(r"<img\s+([^>]*)/>", img_to_attachment, html)
 
-    return html
+# Inline formatting tag -> markdown delimiter
+_INLINE_MARKS = {"strong": "**", "b": "**", "em": "*", "i": "*", "code": "`"}
 
+# List item indents by nesting depth
+_LI_INDENTS = tuple("  " * depth for depth in range(32))
 
-def _get_tag(elem: ET.Element) -> str:
-    """Get local tag name without namespace."""
-    return elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+
+# Qualified tag -> local name. Pages draw on a small, fixed vocabulary of
+# tags, so this stays small.
+_LOCAL_TAGS: dict[str, str] = {}
 
 
-def _get_attr(elem: ET.Element, name: str, ns: str | None = None) -> str | None:
-    """Get attribute value, checking both namespaced and prefixed forms."""
-    if ns:
-        # Try full namespace URI form first
-        val = elem.get(f"{{{ns}}}{name}")
-        if val is not None:
-            return val
-    # Try without namespace
-    return elem.get(name)
+def _get_tag(elem: ET.Element) -> str:
+    """Get local tag name without namespace."""
+    tag = elem.tag
+    local = _LOCAL_TAGS.get(tag)
+    if local is None:
+        local = _LOCAL_TAGS[tag] = tag.rpartition("}")[2]
+    return local
 
 
 def _extract_code_macro(elem: ET.Element) -> tuple[str, str]:
@@ -261,7 +403,7 @@ def _extract_code_macro(elem: ET.Element) -> tuple[str, str]:
     for child in elem:
         tag = _get_tag(child)
         if tag == "parameter":
-            param_name = _get_attr(child, "name", AC_NS) or _get_attr(child, "name")
+            param_name = child.get(_AC_NAME) or child.get("name")
             if param_name == "language":
                 lang = (child.text or "").strip()
         elif tag == "plain-text-body":
@@ -270,159 +412,289 @@ def _extract_code_macro(elem: ET.Element) -> tuple[str, str]:
     return lang, code
 
 
-def _elem_to_markdown(
+def _md_macro(
     elem: ET.Element,
+    tag: str,
     image_dir: str,
     list_stack: list[tuple],
     in_table: bool,
     table_state: dict,
-) -> str:
-    """Recursively convert an XML element to markdown."""
-    tag = _get_tag(elem)
-
-    # Confluence structured-macro
-    if tag == "structured-macro":
-        macro_name = _get_attr(elem, "name", AC_NS) or _get_attr(elem, "name")
-        if macro_name == "code":
-            lang, code = _extract_code_macro(elem)
-            lang = LANG_MAP_REVERSE.get(lang.lower(), lang.lower()) if lang else ""
-            code = code.rstrip("\n")
-            return f"\n```{lang}\n{code}\n```\n"
-        elif macro_name == "toc":
-            return "\n[TOC]\n"
-        # Unknown macro - skip
-        return ""
-
-    # Confluence image with attachment
-    if tag == "image":
-        alt = _get_attr(elem, "alt", AC_NS) or ""
-        for child in elem:
-            if _get_tag(child) == "attachment":
-                filename = (
-                    _get_attr(child, "filename", RI_NS)
-                    or _get_attr(child, "filename")
-                    or ""
-                )
-                return f"![{alt}]({image_dir}/{filename})"
-        return ""
-
-    # Headers
-    header_map = {
-        "h1": "#",
-        "h2": "##",
-        "h3": "###",
-        "h4": "####",
-        "h5": "#####",
-        "h6": "######",
-    }
-    if tag in header_map:
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        return f"\n{header_map[tag]} {inner}\n"
-
-    # Lists
-    if tag == "ul":
-        new_stack = list_stack + [("ul",)]
-        prefix = "\n" if list_stack else ""
-        inner = _process_children(elem, image_dir, new_stack, in_table, table_state)
-        suffix = "\n" if not list_stack else ""
-        return prefix + inner + suffix
-
-    if tag == "ol":
-        start = int(elem.get("start", 1))
-        new_stack = list_stack + [("ol", start)]
-        prefix = "\n" if list_stack else ""
-        inner = _process_children(elem, image_dir, new_stack, in_table, table_state)
-        suffix = "\n" if not list_stack else ""
-        return prefix + inner + suffix
-
-    if tag == "li":
-        indent = "  " * (len(list_stack) - 1)
-        if list_stack and list_stack[-1][0] == "ol":
-            num = list_stack[-1][1]
-            marker = f"{indent}{num}. "
-            # Mutate for next sibling - create new tuple
-            list_stack[-1] = ("ol", num + 1)
-        else:
-            marker = f"{indent}- "
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        return marker + inner.strip() + "\n"
-
-    # Table handling
-    if tag == "table":
-        state = {"in_thead": False, "header_done": False}
-        inner = _process_children(elem, image_dir, list_stack, True, state)
-        return "\n" + inner + "\n"
-
-    if tag == "thead":
-        table_state["in_thead"] = True
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        table_state["in_thead"] = False
-        return inner
-
-    if tag == "tbody":
-        return _process_children(elem, image_dir, list_stack, in_table, table_state)
-
-    if tag == "tr":
-        cells = []
-        for child in elem:
-            child_tag = _get_tag(child)
-            if child_tag in {"th", "td"}:
-                cell_text = _process_children(
-                    child, image_dir, list_stack, in_table, table_state
-                )
-                cells.append(cell_text.strip())
-        if not cells:
-            return ""
-        row = "| " + " | ".join(cells) + " |\n"
-        if table_state.get("in_thead") or not table_state.get("header_done"):
-            row += "|" + "|".join(["---"] * len(cells)) + "|\n"
-            table_state["header_done"] = True
-        return row
-
-    if tag in {"th", "td"}:
-        return _process_children(elem, image_dir, list_stack, in_table, table_state)
-
-    # Inline formatting
-    if tag in {"strong", "b"}:
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        return f"**{inner}**"
-
-    if tag in {"em", "i"}:
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        return f"*{inner}*"
-
-    if tag == "code":
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        return f"`{inner}`"
-
-    if tag == "a":
-        href = elem.get("href", "")
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        return f"[{inner}]({href})"
-
-    if tag == "img":
-        src = elem.get("src", "")
-        alt = elem.get("alt", "")
-        return f"![{alt}]({src})"
-
-    if tag == "br":
-        return "\n"
-
-    if tag == "hr":
-        return "\n---\n"
-
-    if tag == "blockquote":
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        lines = inner.strip().split("\n")
-        return "\n" + "\n".join(f"> {line}" for line in lines) + "\n"
-
-    # Block elements that just add spacing
-    if tag in {"p", "div"}:
-        inner = _process_children(elem, image_dir, list_stack, in_table, table_state)
-        return inner + "\n\n"
-
-    # Default: process children
-    return _process_children(elem, image_dir, list_stack, in_table, table_state)
+    out: list[str],
+) -> None:
+    """Confluence structured-macro: code and TOC; others are skipped."""
+    macro_name = elem.get(_AC_NAME) or elem.get("name")
+    if macro_name == "code":
+        lang, code = _extract_code_macro(elem)
+        lang = LANG_MAP_REVERSE.get(lang.lower(), lang.lower()) if lang else ""
+        code = code.rstrip("\n")
+        out.append(f"\n```{lang}\n{code}\n```\n")
+    elif macro_name == "toc":
+        out.append("\n[TOC]\n")
+    # Unknown macro - skip
+
+
+def _md_image(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    """Confluence image with attachment."""
+    alt = elem.get(_AC_ALT, elem.get("alt")) or ""
+    for child in elem:
+        if _get_tag(child) == "attachment":
+            filename = child.get(_RI_FILENAME) or child.get("filename") or ""
+            out.append(f"![{alt}]({image_dir}/{filename})")
+            return
+
+
+def _md_header(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    out.append(f"\n{_HEADER_LEVELS[tag]} ")
+    _process_children(elem, image_dir, list_stack, in_table, table_state, out)
+    out.append("\n")
+
+
+def _md_ul(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    new_stack = list_stack + [("ul",)]
+    if list_stack:
+        out.append("\n")
+    _process_children(elem, image_dir, new_stack, in_table, table_state, out)
+    if not list_stack:
+        out.append("\n")
+
+
+def _md_ol(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    start = int(elem.get("start", 1))
+    new_stack = list_stack + [("ol", start)]
+    if list_stack:
+        out.append("\n")
+    _process_children(elem, image_dir, new_stack, in_table, table_state, out)
+    if not list_stack:
+        out.append("\n")
+
+
+def _md_li(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    depth = len(list_stack) - 1
+    # A stray <li> outside any list has depth -1 and no indent
+    indent = _LI_INDENTS[depth] if 0 <= depth < len(_LI_INDENTS) else "  " * depth
+    if list_stack and list_stack[-1][0] == "ol":
+        num = list_stack[-1][1]
+        marker = f"{indent}{num}. "
+        # Mutate for next sibling - create new tuple
+        list_stack[-1] = ("ol", num + 1)
+    else:
+        marker = f"{indent}- "
+    inner = _children_text(elem, image_dir, list_stack, in_table, table_state)
+    out.append(marker + inner.strip() + "\n")
+
+
+def _md_table(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    state = {"in_thead": False, "header_done": False}
+    out.append("\n")
+    _process_children(elem, image_dir, list_stack, True, state, out)
+    out.append("\n")
+
+
+def _md_thead(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    table_state["in_thead"] = True
+    _process_children(elem, image_dir, list_stack, in_table, table_state, out)
+    table_state["in_thead"] = False
+
+
+def _md_tr(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    cells = []
+    for child in elem:
+        child_tag = _get_tag(child)
+        if child_tag in {"th", "td"}:
+            cell_text = _children_text(
+                child, image_dir, list_stack, in_table, table_state
+            )
+            cells.append(cell_text.strip())
+    if not cells:
+        return
+    out.append("| " + " | ".join(cells) + " |\n")
+    if table_state.get("in_thead") or not table_state.get("header_done"):
+        out.append("|" + "|".join(["---"] * len(cells)) + "|\n")
+        table_state["header_done"] = True
+
+
+def _md_inline(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    """Inline formatting: wrap the content in its markdown delimiter."""
+    mark = _INLINE_MARKS[tag]
+    out.append(mark)
+    _process_children(elem, image_dir, list_stack, in_table, table_state, out)
+    out.append(mark)
+
+
+def _md_a(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    href = elem.get("href", "")
+    out.append("[")
+    _process_children(elem, image_dir, list_stack, in_table, table_state, out)
+    out.append(f"]({href})")
+
+
+def _md_img(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    src = elem.get("src", "")
+    alt = elem.get("alt", "")
+    out.append(f"![{alt}]({src})")
+
+
+def _md_br(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    out.append("\n")
+
+
+def _md_hr(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    out.append("\n---\n")
+
+
+def _md_blockquote(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    inner = _children_text(elem, image_dir, list_stack, in_table, table_state)
+    lines = inner.strip().split("\n")
+    out.append("\n" + "\n".join(f"> {line}" for line in lines) + "\n")
+
+
+def _md_block(
+    elem: ET.Element,
+    tag: str,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+    out: list[str],
+) -> None:
+    """Block elements that just add spacing."""
+    _process_children(elem, image_dir, list_stack, in_table, table_state, out)
+    out.append("\n\n")
+
+
+# Element converters by local tag name. Tags not listed (tbody, th, td,
+# unknown HTML) just contribute their children.
+_ELEM_HANDLERS = {
+    "structured-macro": _md_macro,
+    "image": _md_image,
+    **dict.fromkeys(_HEADER_LEVELS, _md_header),
+    "ul": _md_ul,
+    "ol": _md_ol,
+    "li": _md_li,
+    "table": _md_table,
+    "thead": _md_thead,
+    "tr": _md_tr,
+    **dict.fromkeys(_INLINE_MARKS, _md_inline),
+    "a": _md_a,
+    "img": _md_img,
+    "br": _md_br,
+    "hr": _md_hr,
+    "blockquote": _md_blockquote,
+    "p": _md_block,
+    "div": _md_block,
+}
 
 
 def _process_children(
@@ -431,33 +703,45 @@ def _process_children(
     list_stack: list[tuple],
     in_table: bool,
     table_state: dict,
-) -> str:
-    """Process element's text and children."""
-    result = []
+    out: list[str],
+) -> None:
+    """Process element's text and children, appending to out."""
+    add = out.append
+    # Whitespace-only text between list/table elements is layout, not content
+    skip_blank = bool(list_stack or in_table)
 
     # Element's direct text
-    if elem.text:
-        text = elem.text
-        # Skip whitespace-only in lists/tables
-        if (list_stack or in_table) and not text.strip():
-            pass
-        else:
-            result.append(text)
+    text = elem.text
+    if text and not (skip_blank and text.isspace()):
+        add(text)
 
-    # Process children
+    # Process children, dispatching on tag here rather than through a
+    # separate per-element function: one Python frame less per tree level
+    get_handler = _ELEM_HANDLERS.get
     for child in elem:
-        result.append(
-            _elem_to_markdown(child, image_dir, list_stack, in_table, table_state)
-        )
+        tag = _get_tag(child)
+        handler = get_handler(tag)
+        if handler is None:
+            _process_children(child, image_dir, list_stack, in_table, table_state, out)
+        else:
+            handler(child, tag, image_dir, list_stack, in_table, table_state, out)
         # Tail text after child
-        if child.tail:
-            tail = child.tail
-            if (list_stack or in_table) and not tail.strip():
-                pass
-            else:
-                result.append(tail)
+        tail = child.tail
+        if tail and not (skip_blank and tail.isspace()):
+            add(tail)
 
-    return "".join(result)
+
+def _children_text(
+    elem: ET.Element,
+    image_dir: str,
+    list_stack: list[tuple],
+    in_table: bool,
+    table_state: dict,
+) -> str:
+    """Convert element's text and children to a string, for reshaping."""
+    parts: list[str] = []
+    _process_children(elem, image_dir, list_stack, in_table, table_state, parts)
+    return "".join(parts)
 
 
 def storage_to_markdown(html_content: str, image_dir: str = "./images") -> str:
@@ -470,30 +754,23 @@ def storage_to_markdown(html_content: str, image_dir: str = "./images") -> str:
     Returns:
         Markdown text
     """
-    # Wrap content in root element with namespace declarations
-    wrapped = f'<root xmlns:ac="{AC_NS}" xmlns:ri="{RI_NS}">{html_content}</root>'
+    # Wrap content in root element with namespace and HTML entity declarations;
+    # the declarations are only needed when the content uses entities
+    doctype = _STORAGE_DOCTYPE if "&" in html_content else ""
+    wrapped = doctype + _STORAGE_ROOT_OPEN + html_content + "</root>"
 
     try:
         root = ET.fromstring(wrapped)
-    except ET.ParseError:
-        # Handle common issues: HTML entities not defined in XML
-        # Replace common HTML entities with Unicode equivalents
-        html_content = html_content.replace("&nbsp;", "\u00a0")
-        html_content = html_content.replace("&ldquo;", "\u201c")
-        html_content = html_content.replace("&rdquo;", "\u201d")
-        html_content = html_content.replace("&lsquo;", "\u2018")
-        html_content = html_content.replace("&rsquo;", "\u2019")
-        html_content = html_content.replace("&mdash;", "\u2014")
-        html_content = html_content.replace("&ndash;", "\u2013")
-        html_content = html_content.replace("&hellip;", "\u2026")
-        wrapped = f'<root xmlns:ac="{AC_NS}" xmlns:ri="{RI_NS}">{html_content}</root>'
-        try:
-            root = ET.fromstring(wrapped)
-        except ET.ParseError as e:
-            raise ValueError(f"Failed to parse Confluence storage format: {e}") from e
-
-    text = _elem_to_markdown(root, image_dir, [], False, {})
-
-    # Collapse multiple newlines into max 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    except ET.ParseError as e:
+        raise ValueError(f"Failed to parse Confluence storage format: {e}") from e
+
+    # Fragments from the whole tree go into one list, joined once
+    out: list[str] = []
+    _process_children(root, image_dir, [], False, {}, out)
+    text = "".join(out)
+
+    # Collapse multiple newlines into max 2. Each pass shortens every run of
+    # three or more by a third; clean text exits after the membership test.
+    while "\n\n\n" in text:
+        text = text.replace("\n\n\n", "\n\n")
     return text.strip()
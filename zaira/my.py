@@ -1,10 +1,14 @@
 """Show my open tickets."""
 
+from __future__ import annotations
+
 import argparse
+from datetime import UTC, datetime
+from operator import itemgetter
+from typing import TYPE_CHECKING
 
-from zaira.jira_client import get_jira
-from zaira.report import humanize_age
-from zaira.types import MyTicket
+if TYPE_CHECKING:
+    from zaira.types import MyTicket
 
 
 DEFAULT_ASSIGNED_JQL = (
@@ -19,11 +23,19 @@ DEFAULT_REPORTED_JQL = (
     "ORDER BY updated DESC"
 )
 
+# Summaries longer than this are cut and end in "..."
+_SUMMARY_MAX = 100
+_SUMMARY_CUT = _SUMMARY_MAX - 3
+
 
 def search_my_tickets(jql: str) -> list[MyTicket]:
     """Search for tickets and return minimal ticket data."""
+    from zaira.jira_client import get_jira
+
     jira = get_jira()
-    issues = jira.search_issues(jql, maxResults=False)
+    # Only the fields shown in the table; the default is every field. Raw JSON
+    # results can't be paged by the client, so Issue objects are kept.
+    issues = jira.search_issues(jql, maxResults=False, fields="summary,status,created")
     tickets = []
     for issue in issues:
         fields = issue.fields
@@ -40,31 +52,32 @@ def search_my_tickets(jql: str) -> list[MyTicket]:
 
 def print_table(tickets: list[MyTicket]) -> None:
     """Print tickets grouped by status."""
+    from zaira.report import humanize_age
+
     if not tickets:
         print("No open tickets.")
         return
 
-    key_width = max(len(t["key"]) for t in tickets)
-
-    # Group tickets by status
+    # Group tickets by status, measuring the key column on the way
+    key_width = 0
     groups: dict[str, list[MyTicket]] = {}
     for t in tickets:
-        status = t["status"]
-        if status not in groups:
-            groups[status] = []
-        groups[status].append(t)
+        key_width = max(key_width, len(t["key"]))
+        groups.setdefault(t["status"], []).append(t)
+
+    # Ages are measured against a single clock read for the whole table
+    now = datetime.now(UTC)
 
     for status, group_tickets in groups.items():
         # Sort by created date (oldest first)
-        group_tickets.sort(key=lambda t: t["created"])
+        group_tickets.sort(key=itemgetter("created"))
         print(f"\n{status} ({len(group_tickets)})")
         print("-" * (len(status) + len(str(len(group_tickets))) + 3))
         for t in group_tickets:
-            age = humanize_age(t["created"])
+            age = humanize_age(t["created"], now)
             summary = t["summary"]
-            max_summary = 100
-            if len(summary) > max_summary:
-                summary = summary[: max_summary - 3] + "..."
+            if len(summary) > _SUMMARY_MAX:
+                summary = f"{summary[:_SUMMARY_CUT]}..."
             print(f"{t['key']:<{key_width}}  {age:>5}  {summary}")
 
 
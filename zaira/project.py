@@ -1,16 +1,29 @@
 """Project configuration handling."""
 
 import tomllib
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=4)
+def _read_config(path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse a config file; keyed on its stat so edits are picked up."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def load_config() -> dict:
-    """Load zproject.toml if it exists."""
-    config_path = Path("zproject.toml")
-    if config_path.exists():
-        with open(config_path, "rb") as f:
-            return tomllib.load(f)
-    return {}
+    """Load zproject.toml if it exists.
+
+    The parsed config is cached until the file changes, so treat the
+    returned dict as read-only.
+    """
+    config_path = Path("zproject.toml").absolute()
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return {}
+    return _read_config(config_path, st.st_mtime_ns, st.st_size)
 
 
 def get_query(name: str) -> str | None:
@@ -5,8 +5,11 @@ import csv
 import io
 import json
 import sys
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
 
 from zaira.config import REPORTS_DIR
 from zaira.jira_client import get_jira
@@ -56,14 +59,28 @@ def _group_tickets_by(
     return groups
 
 
-def humanize_age(iso_timestamp: str) -> str:
-    """Convert ISO timestamp to human-readable age like '2d' or '3w'."""
+@lru_cache(maxsize=4096)
+def _parse_iso(iso_timestamp: str) -> datetime:
+    """Parse an ISO timestamp, caching results for repeated values."""
+    # Jira format: 2026-01-11T14:30:00.000+0000
+    if iso_timestamp.endswith("+0000"):
+        iso_timestamp = iso_timestamp[:-5] + "+00:00"
+    return datetime.fromisoformat(iso_timestamp)
+
+
+def humanize_age(iso_timestamp: str, now: datetime | None = None) -> str:
+    """Convert ISO timestamp to human-readable age like '2d' or '3w'.
+
+    Args:
+        iso_timestamp: ISO timestamp string
+        now: Reference time (defaults to current UTC time)
+    """
     if not iso_timestamp:
         return "-"
     try:
-        # Parse ISO timestamp (Jira format: 2026-01-11T14:30:00.000+0000)
-        dt = datetime.fromisoformat(iso_timestamp.replace("+0000", "+00:00"))
-        now = datetime.now(timezone.utc)
+        dt = _parse_iso(iso_timestamp)
+        if now is None:
+            now = datetime.now(UTC)
         delta = now - dt
 
         seconds = delta.total_seconds()
@@ -90,24 +107,19 @@ def humanize_age(iso_timestamp: str) -> str:
         return "-"
 
 
-def get_ticket_dates(key: str) -> dict:
-    """Fetch created and updated timestamps for a ticket."""
-    jira = get_jira()
-    try:
-        issue = jira.issue(key, fields="created,updated")
-        return {
-            "created": issue.fields.created or "",
-            "updated": issue.fields.updated or "",
-        }
-    except Exception:
-        return {"created": "", "updated": ""}
+# Fields read when building ticket dicts; the default is every field,
+# custom fields included
+_SEARCH_FIELDS = (
+    "summary,issuetype,status,priority,assignee,reporter,labels,components,"
+    "project,resolution,fixVersions,duedate,created,updated,parent"
+)
 
 
 def search_tickets(jql: str) -> list[ReportTicket]:
     """Search for tickets and return list of ticket data."""
     jira = get_jira()
     try:
-        issues = jira.search_issues(jql, maxResults=False)
+        issues = jira.search_issues(jql, maxResults=False, fields=_SEARCH_FIELDS)
         tickets = []
         for issue in issues:
             fields = issue.fields
@@ -123,27 +135,31 @@ def search_tickets(jql: str) -> list[ReportTicket]:
                     else "",
                 }
 
+            # Read each nested field once rather than at every use
+            issuetype = fields.issuetype
+            status = fields.status
+            category = status.statusCategory if status else None
+            priority = fields.priority
+            assignee = fields.assignee
+            reporter = fields.reporter
+            project = fields.project
+            resolution = fields.resolution
+
             ticket = {
                 "key": issue.key,
                 "summary": fields.summary or "",
-                "issuetype": fields.issuetype.name if fields.issuetype else "?",
-                "status": fields.status.name if fields.status else "?",
-                "statusCategory": fields.status.statusCategory.name
-                if fields.status and fields.status.statusCategory
-                else None,
-                "priority": fields.priority.name if fields.priority else "-",
-                "assignee": get_user_identifier(fields.assignee) or "-",
-                "assigneeDisplayName": fields.assignee.displayName
-                if fields.assignee
-                else None,
-                "reporter": get_user_identifier(fields.reporter),
-                "reporterDisplayName": fields.reporter.displayName
-                if fields.reporter
-                else None,
+                "issuetype": issuetype.name if issuetype else "?",
+                "status": status.name if status else "?",
+                "statusCategory": category.name if category else None,
+                "priority": priority.name if priority else "-",
+                "assignee": get_user_identifier(assignee) or "-",
+                "assigneeDisplayName": assignee.displayName if assignee else None,
+                "reporter": get_user_identifier(reporter),
+                "reporterDisplayName": reporter.displayName if reporter else None,
                 "labels": labels,
                 "components": [c.name for c in (fields.components or [])],
-                "project": fields.project.key if fields.project else None,
-                "resolution": fields.resolution.name if fields.resolution else None,
+                "project": project.key if project else None,
+                "resolution": resolution.name if resolution else None,
                 "fixVersions": [
                     v.name for v in (getattr(fields, "fixVersions", None) or [])
                 ],
@@ -159,6 +175,18 @@ def search_tickets(jql: str) -> list[ReportTicket]:
         return []
 
 
+# Report options recorded in front matter, in output order:
+# (front matter key, CLI flag, quote in YAML, quote on command line)
+_FRONT_MATTER_SPEC = (
+    ("query", "--query", False, False),
+    ("jql", "--jql", True, True),
+    ("board", "--board", False, False),
+    ("sprint", "--sprint", False, False),
+    ("label", "--label", False, True),
+    ("group_by", "--group-by", False, False),
+)
+
+
 def generate_front_matter(
     title: str,
     jql: str | None = None,
@@ -173,26 +201,24 @@ def generate_front_matter(
     lines.append(f"title: {title}")
     lines.append(f"generated: {datetime.now().isoformat(timespec='seconds')}")
 
+    # Raw JQL is only recorded when no named query, board or sprint produced it
+    values = {
+        "query": query,
+        "jql": None if query or board or sprint else jql,
+        "board": board,
+        "sprint": sprint,
+        "label": label,
+        "group_by": group_by,
+    }
+
     # Refresh command
     cmd_parts = ["zaira report"]
-    if query:
-        lines.append(f"query: {query}")
-        cmd_parts.append(f"--query {query}")
-    elif jql and not board and not sprint:
-        lines.append(f'jql: "{jql}"')
-        cmd_parts.append(f'--jql "{jql}"')
-    if board:
-        lines.append(f"board: {board}")
-        cmd_parts.append(f"--board {board}")
-    if sprint:
-        lines.append(f"sprint: {sprint}")
-        cmd_parts.append(f"--sprint {sprint}")
-    if label:
-        lines.append(f"label: {label}")
-        cmd_parts.append(f'--label "{label}"')
-    if group_by:
-        lines.append(f"group_by: {group_by}")
-        cmd_parts.append(f"--group-by {group_by}")
+    for key, flag, quote_yaml, quote_cmd in _FRONT_MATTER_SPEC:
+        value = values[key]
+        if not value:
+            continue
+        lines.append(f'{key}: "{value}"' if quote_yaml else f"{key}: {value}")
+        cmd_parts.append(f'{flag} "{value}"' if quote_cmd else f"{flag} {value}")
 
     cmd_parts.append(f'--title "{title}"')
     lines.append(f"refresh: {' '.join(cmd_parts)}")
@@ -211,24 +237,26 @@ def generate_report(
     label: str | None = None,
 ) -> str:
     """Generate markdown report from tickets."""
-    md = generate_front_matter(title, jql, query, board, sprint, group_by, label)
-    md += f"# {title}\n\n"
-    md += f"**Total:** {len(tickets)} tickets\n\n"
+    parts = [
+        generate_front_matter(title, jql, query, board, sprint, group_by, label),
+        f"# {title}\n\n",
+        f"**Total:** {len(tickets)} tickets\n\n",
+    ]
 
     if not tickets:
-        md += "_No tickets found._\n"
-        return md
+        parts.append("_No tickets found._\n")
+        return "".join(parts)
 
     if group_by:
         groups = _group_tickets_by(tickets, group_by)
         for group_name, group_tickets in sorted(groups.items()):
-            md += f"## {group_name} ({len(group_tickets)})\n\n"
-            md += generate_table(group_tickets, group_by=group_by)
-            md += "\n"
+            parts.append(f"## {group_name} ({len(group_tickets)})\n\n")
+            parts.append(generate_table(group_tickets, group_by=group_by))
+            parts.append("\n")
     else:
-        md += generate_table(tickets)
+        parts.append(generate_table(tickets))
 
-    return md
+    return "".join(parts)
 
 
 def generate_table(tickets: list[ReportTicket], group_by: str | None = None) -> str:
@@ -241,31 +269,28 @@ def generate_table(tickets: list[ReportTicket], group_by: str | None = None) ->
     if not tickets:
         return "_No tickets_\n"
 
-    # Check if any tickets have parents
-    has_parents = any(t.get("parent") for t in tickets)
-
-    # Build columns, excluding the group_by field
-    columns = ["Key", "Type", "Status", "Age"]
-    if has_parents and group_by != "parent":
-        columns.append("Parent")
-    columns.append("Summary")
-
-    # Remove grouped column
-    if group_by == "status":
-        columns.remove("Status")
-    elif group_by == "issuetype":
-        columns.remove("Type")
-
-    # Build all rows first to calculate column widths
+    # Build all rows first to calculate column widths. Whether the Parent
+    # column is needed is only known once every ticket has been seen, so
+    # parent keys are collected in the same pass and spliced in afterwards.
+    # Ages are measured against a single clock read for the whole table
+    now = datetime.now(UTC)
     rows: list[list[str]] = []
+    parent_keys: list[str] = []
+    has_parents = False
     for t in tickets:
         key = t.get("key", "?")
         issue_type = t.get("issuetype", "?")
         status = t.get("status", "?")
-        age = humanize_age(t.get("updated", ""))
+        age = humanize_age(t.get("updated", ""), now)
         summary = t.get("summary", "")
         parent = t.get("parent")
 
+        if parent:
+            has_parents = True
+            parent_keys.append(parent["key"])
+        else:
+            parent_keys.append("-")
+
         # Truncate long summaries
         if len(summary) > 200:
             summary = summary[:197] + "..."
@@ -273,11 +298,7 @@ def generate_table(tickets: list[ReportTicket], group_by: str | None = None) ->
         # Escape pipes in summary
         summary = summary.replace("|", "\\|")
 
-        # Build row based on columns
-        row = [key, issue_type, status, age]
-        if has_parents and group_by != "parent":
-            row.append(parent["key"] if parent else "-")
-        row.append(summary)
+        row = [key, issue_type, status, age, summary]
 
         # Remove grouped column value
         if group_by == "status":
@@ -287,6 +308,19 @@ def generate_table(tickets: list[ReportTicket], group_by: str | None = None) ->
 
         rows.append(row)
 
+    # Build columns, excluding the group_by field
+    columns = ["Key", "Type", "Status", "Age", "Summary"]
+    if group_by == "status":
+        columns.remove("Status")
+    elif group_by == "issuetype":
+        columns.remove("Type")
+
+    # Parent goes just before Summary
+    if has_parents and group_by != "parent":
+        columns.insert(-1, "Parent")
+        for row, parent_key in zip(rows, parent_keys):
+            row.insert(-1, parent_key)
+
     # Calculate column widths (min 3 for separator)
     # Cap Status column at 12 chars - longer values will overflow
     max_widths = {"Status": 12}
@@ -298,18 +332,18 @@ def generate_table(tickets: list[ReportTicket], group_by: str | None = None) ->
 
     # Generate header
     header_cells = [h.ljust(col_widths[i]) for i, h in enumerate(columns)]
-    md = "| " + " | ".join(header_cells) + " |\n"
+    lines = ["| " + " | ".join(header_cells) + " |"]
 
     # Generate separator
     sep_cells = ["-" * col_widths[i] for i in range(len(columns))]
-    md += "| " + " | ".join(sep_cells) + " |\n"
+    lines.append("| " + " | ".join(sep_cells) + " |")
 
     # Generate rows
     for row in rows:
         padded = [cell.ljust(col_widths[i]) for i, cell in enumerate(row)]
-        md += "| " + " | ".join(padded) + " |\n"
+        lines.append("| " + " | ".join(padded) + " |")
 
-    return md
+    return "\n".join(lines) + "\n"
 
 
 def generate_json_report(
@@ -344,37 +378,60 @@ def generate_json_report(
     return json.dumps(data, indent=2)
 
 
-def generate_csv_report(tickets: list[ReportTicket]) -> str:
-    """Generate CSV report from tickets."""
+# Column order of CSV reports
+_CSV_FIELDS = (
+    "key",
+    "summary",
+    "issuetype",
+    "status",
+    "priority",
+    "assignee",
+    "labels",
+    "parent",
+    "created",
+    "updated",
+)
+
+
+def generate_csv_report(
+    tickets: list[ReportTicket], file: TextIO | None = None
+) -> str | None:
+    """Generate CSV report from tickets.
+
+    Args:
+        tickets: List of ticket data
+        file: Writable text stream to write rows to as they are produced.
+            When omitted, the CSV is built in memory and returned.
+
+    Returns:
+        CSV text, or None when written to file
+    """
     if not tickets:
-        return ""
-
-    output = io.StringIO()
-    fieldnames = [
-        "key",
-        "summary",
-        "issuetype",
-        "status",
-        "priority",
-        "assignee",
-        "labels",
-        "parent",
-        "created",
-        "updated",
-    ]
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
-    writer.writeheader()
+        return "" if file is None else None
+
+    output = io.StringIO() if file is None else file
+    writer = csv.writer(output)
+    writer.writerow(_CSV_FIELDS)
 
     for t in tickets:
-        row = {**t}
-        # Convert labels list to comma-separated string
-        row["labels"] = ",".join(t.get("labels", []))
-        # Convert parent dict to key
         parent = t.get("parent")
-        row["parent"] = parent["key"] if parent else ""
-        writer.writerow(row)
+        writer.writerow(
+            (
+                t.get("key"),
+                t.get("summary"),
+                t.get("issuetype"),
+                t.get("status"),
+                t.get("priority"),
+                t.get("assignee"),
+                # Labels list as comma-separated string, parent dict as key
+                ",".join(t.get("labels", [])),
+                parent["key"] if parent else "",
+                t.get("created"),
+                t.get("updated"),
+            )
+        )
 
-    return output.getvalue()
+    return output.getvalue() if file is None else None
 
 
 def generate_dashboard_report(
@@ -426,40 +483,47 @@ def generate_dashboard_report(
     lines.append(f"**Dashboard URL:** {dashboard.view_url}")
     lines.append("")
 
-    total_tickets = 0
-
-    # Run each gadget's JQL and generate a section
-    for gadget in sorted(jql_gadgets, key=lambda x: x.position):
-        title = gadget.filter_name or gadget.title or f"Query {gadget.id}"
-        if not to_stdout:
-            print(f"  Running: {title}")
-
-        tickets = search_tickets(gadget.jql)
-        total_tickets += len(tickets)
-
-        if not to_stdout:
-            print(f"    Found {len(tickets)} tickets")
-
-        lines.append(f"## {title}")
-        lines.append("")
-        lines.append(f"**JQL:** `{gadget.jql}`")
-        lines.append("")
-        lines.append(f"**Results:** {len(tickets)} tickets")
-        lines.append("")
-
-        if tickets:
-            if group_by:
-                groups = _group_tickets_by(tickets, group_by)
-                for group_name, group_tickets in sorted(groups.items()):
-                    lines.append(f"### {group_name} ({len(group_tickets)})")
-                    lines.append("")
-                    lines.append(generate_table(group_tickets, group_by=group_by))
+    ordered_gadgets = sorted(jql_gadgets, key=lambda x: x.position)
+
+    # Gadget queries are independent round-trips, so run them concurrently.
+    # Warm the shared client first so threads reuse it.
+    get_jira()
+    with ThreadPoolExecutor(max_workers=min(5, len(ordered_gadgets))) as executor:
+        futures = [executor.submit(search_tickets, g.jql) for g in ordered_gadgets]
+
+        # Sections are rendered in order as each result comes in
+        total_tickets = 0
+        for gadget, future in zip(ordered_gadgets, futures):
+            title = gadget.filter_name or gadget.title or f"Query {gadget.id}"
+            if not to_stdout:
+                print(f"  Running: {title}")
+
+            tickets = future.result()
+            total_tickets += len(tickets)
+
+            if not to_stdout:
+                print(f"    Found {len(tickets)} tickets")
+
+            lines.append(f"## {title}")
+            lines.append("")
+            lines.append(f"**JQL:** `{gadget.jql}`")
+            lines.append("")
+            lines.append(f"**Results:** {len(tickets)} tickets")
+            lines.append("")
+
+            if tickets:
+                if group_by:
+                    groups = _group_tickets_by(tickets, group_by)
+                    for group_name, group_tickets in sorted(groups.items()):
+                        lines.append(f"### {group_name} ({len(group_tickets)})")
+                        lines.append("")
+                        lines.append(generate_table(group_tickets, group_by=group_by))
+                else:
+                    lines.append(generate_table(tickets))
             else:
-                lines.append(generate_table(tickets))
-        else:
-            lines.append("_No tickets found._")
+                lines.append("_No tickets found._")
 
-        lines.append("")
+            lines.append("")
 
     # Summary
     lines.append("---")
@@ -676,7 +740,8 @@ def report_command(args: argparse.Namespace) -> None:
         )
         ext = "json"
     elif fmt == "csv":
-        report = generate_csv_report(tickets)
+        # Streamed straight to the destination below
+        report = None
         ext = "csv"
     else:
         report = generate_report(
@@ -693,7 +758,10 @@ def report_command(args: argparse.Namespace) -> None:
 
     if to_stdout:
         # Output to stdout
-        print(report)
+        if report is None:
+            generate_csv_report(tickets, sys.stdout)
+        else:
+            print(report)
     else:
         if args.output:
             output_path = Path(args.output)
@@ -703,7 +771,11 @@ def report_command(args: argparse.Namespace) -> None:
             output_path = REPORTS_DIR / f"{slug}.{ext}"
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report)
+        if report is None:
+            with output_path.open("w", newline="") as f:
+                generate_csv_report(tickets, f)
+        else:
+            output_path.write_text(report)
         print(f"Saved to {output_path}")
 
     # Full mode: also export tickets
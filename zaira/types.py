@@ -1,7 +1,7 @@
 """Type definitions for zaira."""
 
 from dataclasses import dataclass
-from typing import Any, TypedDict
+from typing import Any, NamedTuple, TypedDict
 
 
 # === Dataclasses (internal structures) ===
@@ -17,6 +17,14 @@ class Board:
     location: str
 
 
+class BoardSummary(NamedTuple):
+    """Board identity discovered by init-project."""
+
+    id: int
+    name: str
+    type: str
+
+
 @dataclass
 class Sprint:
     """Jira sprint information."""
@@ -245,10 +253,22 @@ class ProjectSchema(TypedDict, total=False):
     """Cached project-specific metadata.
 
     Stored at ~/.cache/zaira/zproject_PROFILE_PROJECT.json.
+    Lists are stored sorted.
+    """
+
+    components: list[str]
+    labels: list[str]
+
+
+class ProjectDiscovery(TypedDict):
+    """Project metadata discovered by init-project.
+
+    Stored at ~/.cache/zaira/zdiscover_PROFILE_PROJECT.json.
     """
 
     components: list[str]
     labels: list[str]
+    boards: list[dict]  # BoardSummary fields
 
 
 # === Utility functions ===